@@ -1,7 +1,27 @@
-"""Setup tools configuration for the zfr CLI utilities."""
-
-import setuptools
-import site
-
-site.ENABLE_USER_SITE = True
-setuptools.setup()
+"""Setup tools configuration for the zfr CLI utilities."""
+
+import os
+import setuptools
+import site
+
+site.ENABLE_USER_SITE = True
+
+ext_modules = []
+
+# The data objects can optionally be compiled with Cython to speed up
+# constructing them in bulk. The pure Python modules are always installed, and
+# are used whenever the compiled versions aren't available. Cython is listed in
+# the build requirements, so it's available in the isolated build environment.
+if os.environ.get('ZFR_ENABLE_SPEEDUPS'):
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        [
+            'src/zfr/dataobjects/cycle.py',
+            'src/zfr/dataobjects/folder.py',
+            'src/zfr/dataobjects/plan.py'
+        ],
+        compiler_directives={'language_level': '3', 'infer_types': True}
+    )
+
+setuptools.setup(ext_modules=ext_modules)
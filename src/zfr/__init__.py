@@ -1 +1 @@
-"""Initialize the zfr CLI utility."""
+"""Initialize the zfr CLI utility."""
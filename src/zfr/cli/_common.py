@@ -0,0 +1,110 @@
+"""Helpers shared by the zfr CLI utilities."""
+
+import os
+
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from zfr.utils import load_ini
+
+_OPTIONS_WITH_VALUES = ('--config', '--username', '--password', '--url')
+"""Top level options that consume the CLI argument that follows them."""
+
+
+def build_main_parser(parent: ArgumentParser, defaults: Dict, description: str) -> ArgumentParser:
+    """Create the main CLI parser.
+
+    Where a configuration file is found, this will load CLI options from the
+    file, over-riding any configuration set via environment variables.
+
+    Args:
+        parent: Parser used to read the configuration file.
+        defaults: Dictionary that contains the CLI argument default values.
+        description: Description of the CLI utility displayed in the help text.
+
+    Returns:
+        The main CLI parser.
+    """
+    parser = ArgumentParser(description=description, parents=[parent])
+    parser.set_defaults(**defaults)
+    return parser
+
+
+def configfile_parser() -> ArgumentParser:
+    """Create the parser used to locate the configuration file.
+
+    Returns:
+        A parser that only accepts the ```--config``` argument.
+    """
+    parser = ArgumentParser(prog=__file__, add_help=False)
+    parser.add_argument('--config', default=None, help='Path to the configuration file (default: ~/zfr.cfg).')
+    return parser
+
+
+def extract_config_arg(argv: List[str]) -> Optional[str]:
+    """Find the value of the ```--config``` argument.
+
+    This avoids a separate argparse pass over the CLI arguments just to
+    locate the configuration file, before the main parser can be built.
+
+    Args:
+        argv: CLI arguments, excluding the program name.
+
+    Returns:
+        Path to the configuration file, or ```None``` if it wasn't specified.
+    """
+    for index, arg in enumerate(argv):
+        if arg == '--':
+            break
+        elif arg == '--config':
+            return argv[index + 1] if index + 1 < len(argv) else None
+        elif arg.startswith('--config='):
+            return arg[len('--config='):]
+
+    return None
+
+
+def load_config(path: Optional[str]) -> Dict[str, str]:
+    """Load the CLI argument defaults from the configuration file.
+
+    Args:
+        path: Path to the configuration file, or ```None``` to use the default
+            ```~/zfr.cfg```.
+
+    Returns:
+        The options defined in the ```jira``` section of the configuration
+        file, or an empty dict if the file doesn't exist.
+    """
+    # resolved here rather than as the argument default, so the home
+    # directory is only looked up when the CLI actually runs.
+    path = path or Path.home() / 'zfr.cfg'
+
+    if os.path.isfile(path):
+        return load_ini(path, 'jira')
+    else:
+        return {}
+
+
+def sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Find the name of the sub-command requested by the user.
+
+    Args:
+        argv: CLI arguments, excluding the program name.
+
+    Returns:
+        The first positional argument, or ```None``` if help was requested
+        before a sub-command, or no sub-command was given.
+    """
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in ('-h', '--help'):
+            return None
+        elif arg.startswith('-'):
+            skip_value = arg in _OPTIONS_WITH_VALUES
+        else:
+            return arg
+
+    return None
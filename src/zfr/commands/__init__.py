@@ -1,25 +1,104 @@
-"""CLI commands responsible for manipulating Zephyr test plans/cases/cycles."""
-
-from abc import ABC, abstractmethod
-from argparse import _SubParsersAction, ArgumentParser, Namespace
-
-
-class CommandBase(ABC):
-    """Base class for CLI commands used to manage Zephyr test configuration."""
-
-    def __init__(self, cli: ArgumentParser) -> None:
-        """Initialise the sub-command.
-
-        Args:
-            cli: ArgParse action that will execute this command.
-        """
-        self._cli = cli
-
-    @abstractmethod
-    def execute(self, args: Namespace) -> None:
-        """Execute the command.
-
-        Args:
-            args: User provided CLI arguments.
-        """
-        pass
+"""CLI commands responsible for manipulating Zephyr test plans/cases/cycles."""
+
+import sys
+
+from abc import ABC, abstractmethod
+from argparse import _SubParsersAction, ArgumentParser, Namespace
+from typing import Any, Dict, Tuple, Type, TypeVar
+from zfr.config import DEFAULT_API_SUFFIX
+
+_Manager = TypeVar('_Manager')
+
+_MANAGERS: Dict[Tuple, Any] = {}
+"""Managers that have already been created, keyed on their connection details."""
+
+_SESSIONS: Dict[Tuple, Any] = {}
+"""HTTP sessions shared by the managers, keyed on their connection details."""
+
+
+class CommandBase(ABC):
+    """Base class for CLI commands used to manage Zephyr test configuration."""
+
+    def __init__(self, cli: ArgumentParser) -> None:
+        """Initialise the sub-command.
+
+        Args:
+            cli: Parser used to invoke this command.
+        """
+        self._cli = cli
+
+    @abstractmethod
+    def execute(self, args: Namespace) -> None:
+        """Execute the command.
+
+        Args:
+            args: User provided CLI arguments.
+        """
+        pass
+
+    def _get_manager(self, manager_cls: Type[_Manager], args: Namespace) -> _Manager:
+        """Get a manager used to interact with the Zephyr Scale API.
+
+        Managers are cached for the lifetime of the process, and every manager
+        connected to the same Jira instance shares a single HTTP session. So
+        commands that are executed repeatedly (eg: when driven from a script),
+        or that use more than one manager, re-use the open connections rather
+        than performing a new TCP/TLS handshake.
+
+        Args:
+            manager_cls: Type of manager to retrieve.
+            args: User provided CLI arguments containing the connection details.
+
+        Returns:
+            A manager connected to the Jira instance specified by the user.
+        """
+        connection = (args.url, args.username, args.password)
+        key = (manager_cls, *connection)
+        manager = _MANAGERS.get(key)
+        if manager is None:
+            from zfr.managers import build_session
+
+            session = _SESSIONS.get(connection)
+            if session is None:
+                session = _SESSIONS[connection] = build_session(*connection)
+
+            manager = manager_cls(
+                args.url,
+                DEFAULT_API_SUFFIX,
+                args.username,
+                args.password,
+                session=session
+            )
+            _MANAGERS[key] = manager
+
+        return manager
+
+    def _write_result(self, result: Any) -> None:
+        """Write the result of the command to stdout as a JSON object.
+
+        The dataclass is serialized directly by orjson, rather than being
+        converted to a dict first, and the encoded bytes are written as is
+        when possible.
+
+        Args:
+            result: Dataclass returned by the command. If empty, a blank line
+                is written instead.
+        """
+        if not result:
+            print()
+            return
+
+        from zfr.dataobjects._json import dumps
+
+        # write the bytes straight to the underlying buffer, unless stdout is
+        # a text only stream (eg: redirected to a StringIO by a script).
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            sys.stdout.write(dumps(result).decode('utf-8'))
+            sys.stdout.write('\n')
+            return
+
+        # flush anything already written as text, before writing the bytes.
+        sys.stdout.flush()
+        buffer.write(dumps(result))
+        buffer.write(b'\n')
@@ -1,6 +1,6 @@
-"""zfr utility configuration."""
-
-from typing import Final
-
-DEFAULT_API_SUFFIX: Final = 'rest/atm/1.0'
-"""Context path used ot access the Zephyr Scale REST API."""
+"""zfr utility configuration."""
+
+from typing import Final
+
+DEFAULT_API_SUFFIX: Final = 'rest/atm/1.0'
+"""Context path used ot access the Zephyr Scale REST API."""
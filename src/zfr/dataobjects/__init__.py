@@ -1,24 +1,156 @@
-"""Data objects used to interact with the Zephyr API."""
-
-import datetime
-from dataclasses import dataclass, field
-
-
-@dataclass
-class Comment:
-    """Represents a user comment.
-
-    _See Also_:
-        [TestPlan][zfr.dataobjects.TestPlan],
-        [TestCase][zfr.dataobjects.TestCase],
-        [TestCycle][zfr.dataobjects.TestCycle]
-    """
-
-    created_by: str = field(default_factory=str)
-    """Username of the user that made the comment."""
-
-    created_on: datetime.datetime = None
-    """Date and time that the comment create made."""
-
-    body: str = field(default_factory=str)
-    """Contents of the comment."""
+"""Data objects used to interact with the Zephyr API.
+
+Timestamps are kept as the ISO-8601 strings returned by the API, see
+```parse_timestamp```.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
+from zfr.dataobjects._codegen import build_from_api, build_to_api
+
+if TYPE_CHECKING:
+    import datetime
+
+ApiFields = Tuple[Tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+"""Maps each API key to a data object attribute, and an optional converter."""
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime.datetime]:
+    """Convert a timestamp returned by the Zephyr Scale API to a datetime.
+
+    Timestamps are stored on the data objects as the strings returned by the
+    API, so that only the values that are actually used get parsed.
+
+    Args:
+        value: ISO-8601 timestamp (eg: 2022-11-02T04:56:01.000Z).
+
+    Returns:
+        A timezone aware datetime, or ```None``` if no value was provided.
+    """
+    if not value:
+        return None
+
+    # both parsers are imported on first use, so loading the data objects
+    # doesn't import the datetime module.
+    try:
+        from ciso8601 import parse_datetime
+    except ImportError:  # optional, installed by the "speed" extra
+        import datetime
+
+        # fromisoformat() doesn't accept the 'Z' suffix prior to python 3.11
+        if value[-1] == 'Z':
+            value = value[:-1] + '+00:00'
+
+        return datetime.datetime.fromisoformat(value)
+
+    return parse_datetime(value)
+
+
+def _eq_on(name: str) -> Callable[[Any, object], bool]:
+    """Create an ```__eq__``` that compares data objects on a single field.
+
+    Used by the data objects that have an identifier which Zephyr guarantees
+    to be unique, so the rest of their fields don't need to be compared.
+
+    Args:
+        name: Name of the identifying field.
+
+    Returns:
+        The ```__eq__``` method.
+    """
+    def __eq__(self: Any, other: object) -> bool:
+        if self is other:
+            return True
+        if type(self) is not type(other):
+            return NotImplemented
+        return getattr(self, name) == getattr(other, name)
+
+    __eq__.__doc__ = f"Compare on the ```{name}```, which Zephyr guarantees to be unique."
+    return __eq__
+
+
+def _intern_status(obj: Any) -> None:
+    """Intern the status, so records sharing a status share one string.
+
+    Used as the ```__post_init__``` of the data objects that have a status.
+
+    Args:
+        obj: The data object that was initialized.
+    """
+    if obj.status:
+        obj.status = sys.intern(obj.status)
+
+
+class ListOf:
+    """Field converter for a list of nested data objects.
+
+    _See Also_:
+        [ApiFields][zfr.dataobjects.ApiFields]
+    """
+
+    __slots__ = ('cls',)
+
+    def __init__(self, cls: type) -> None:
+        """Initialise the converter.
+
+        Args:
+            cls: Data object contained in the list.
+        """
+        self.cls = cls
+
+    def __call__(self, rows: List[Dict[str, Any]]) -> List[Any]:
+        """Create a data object from each entry in an API response.
+
+        Args:
+            rows: Decoded JSON objects returned by the API.
+
+        Returns:
+            The data objects.
+        """
+        from_api = self.cls.from_api
+        return [from_api(row) for row in rows]
+
+    def dump(self, rows: List[Any]) -> List[Dict[str, Any]]:
+        """Convert each data object to its API representation.
+
+        Args:
+            rows: Data objects to be converted.
+
+        Returns:
+            The decoded JSON objects.
+        """
+        return [row.to_api() for row in rows]
+
+
+@dataclass(frozen=True, slots=True)
+class Comment:
+    """Represents a user comment.
+
+    _See Also_:
+        [TestPlan][zfr.dataobjects.TestPlan],
+        [TestCase][zfr.dataobjects.TestCase],
+        [TestCycle][zfr.dataobjects.TestCycle]
+    """
+
+    created_by: str = ''
+    """Username of the user that made the comment."""
+
+    created_on: Optional[str] = None
+    """Date and time that the comment create made."""
+
+    body: str = ''
+    """Contents of the comment."""
+
+
+_COMMENT_FIELDS: ApiFields = (
+    ('createdBy', 'created_by', None),
+    ('createdOn', 'created_on', None),
+    ('body', 'body', None)
+)
+
+Comment.from_api = staticmethod(build_from_api(Comment, _COMMENT_FIELDS))
+Comment.to_api = build_to_api(Comment, _COMMENT_FIELDS)
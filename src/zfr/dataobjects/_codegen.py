@@ -0,0 +1,144 @@
+"""Generates the functions used to convert data objects to/from the Zephyr API.
+
+Each function is compiled once, at import time, from a field table that maps
+the API keys to the data object attributes. The generated code is the same as
+a hand-written conversion, so converting a record doesn't loop over the
+fields, or inspect the dataclass at runtime.
+"""
+
+import inspect
+
+from dataclasses import fields, MISSING
+from typing import Any, Callable, Dict, List
+
+
+def _field_defaults(cls: type) -> Dict[str, Any]:
+    """Get the value used for each constructor argument when it isn't provided.
+
+    Args:
+        cls: Dataclass to inspect.
+
+    Returns:
+        Either the default value, or the default factory wrapped in a list so
+        that it can be told apart from a default value, keyed on argument name
+        in the order that the constructor accepts them.
+    """
+    factories = {
+        fld.name: fld.default_factory
+        for fld in fields(cls)
+        if fld.default_factory is not MISSING
+    }
+    defaults = {}
+
+    # the signature also covers classes such as Folder that define their own
+    # __init__, rather than using the one generated by the dataclass.
+    for name, param in inspect.signature(cls).parameters.items():
+        if name in factories:
+            defaults[name] = [factories[name]]
+        elif param.default is not inspect.Parameter.empty:
+            defaults[name] = param.default
+        else:
+            defaults[name] = None
+
+    return defaults
+
+
+def _compile(source: str, name: str, namespace: Dict[str, Any]) -> Callable:
+    """Compile a generated function.
+
+    Args:
+        source: Source code of the function.
+        name: Name of the function defined by ```source```.
+        namespace: Globals that the generated code can refer to.
+
+    Returns:
+        The compiled function.
+    """
+    exec(compile(source, f'<zfr-codegen {name}>', 'exec'), namespace)
+    return namespace[name]
+
+
+def build_from_api(cls: type, mapping: tuple) -> Callable[[Dict[str, Any]], Any]:
+    """Generate a function that creates a data object from an API response.
+
+    Fields that are missing from the response, or are null, keep their
+    default values.
+
+    Args:
+        cls: Data object to be created.
+        mapping: ```(api key, attribute, converter)``` for each field.
+
+    Returns:
+        A function that accepts the decoded JSON object and returns a new
+        ```cls```.
+    """
+    namespace: Dict[str, Any] = {'_cls': cls}
+    fields_by_attr = {attr: (api_key, convert) for api_key, attr, convert in mapping}
+    lines: List[str] = ['def from_api(data):', '    get = data.get', '    return _cls(']
+
+    # arguments are passed positionally, in the order the constructor accepts
+    # them, which avoids building a kwargs dict for every object.
+    for index, (attr, default) in enumerate(_field_defaults(cls).items()):
+        if isinstance(default, list):
+            namespace[f'_f{index}'] = default[0]
+            fallback = f'_f{index}()'
+        else:
+            namespace[f'_d{index}'] = default
+            fallback = f'_d{index}'
+
+        if attr not in fields_by_attr:
+            lines.append(f'        {fallback},  # {attr}')
+            continue
+
+        api_key, convert = fields_by_attr[attr]
+        value = 'v'
+        if convert is not None:
+            namespace[f'_c{index}'] = convert
+            value = f'_c{index}(v)'
+
+        if value == 'v' and default is None:
+            lines.append(f'        get({api_key!r}),  # {attr}')
+        else:
+            lines.append(
+                f'        {value} if (v := get({api_key!r})) is not None else {fallback},  # {attr}'
+            )
+
+    lines.append('    )')
+
+    func = _compile('\n'.join(lines), 'from_api', namespace)
+    func.__doc__ = f'Create a {cls.__name__} from its Zephyr Scale API representation.'
+    return func
+
+
+def build_to_api(cls: type, mapping: tuple) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a method that converts a data object to an API request body.
+
+    Converters that provide a ```dump``` method are used to convert the value
+    back to its API representation. Any other value is passed through as is.
+
+    Args:
+        cls: Data object to be converted.
+        mapping: ```(api key, attribute, converter)``` for each field.
+
+    Returns:
+        A method that returns the data object as a dict keyed on the API
+        field names.
+    """
+    namespace: Dict[str, Any] = {}
+    lines: List[str] = ['def to_api(self):', '    return {']
+
+    for index, (api_key, attr, convert) in enumerate(mapping):
+        dump = getattr(convert, 'dump', None)
+        if dump is None:
+            lines.append(f'        {api_key!r}: self.{attr},')
+        else:
+            namespace[f'_c{index}'] = dump
+            lines.append(
+                f'        {api_key!r}: None if (v := self.{attr}) is None else _c{index}(v),'
+            )
+
+    lines.append('    }')
+
+    func = _compile('\n'.join(lines), 'to_api', namespace)
+    func.__doc__ = f'Convert the {cls.__name__} to its Zephyr Scale API representation.'
+    return func
@@ -0,0 +1,36 @@
+"""JSON encoding/decoding used for API payloads and command output.
+
+orjson serializes dataclasses natively, and decodes directly from the raw
+response bytes, avoiding the extra decode step performed by requests.
+"""
+
+from typing import Any
+
+import orjson
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact, UTF-8 encoded JSON.
+
+    Dataclasses are serialized using their field names, including any
+    dataclasses nested within them.
+
+    Args:
+        obj: Object to be serialized.
+
+    Returns:
+        The JSON document.
+    """
+    return orjson.dumps(obj)
+
+
+def loads(data: bytes) -> Any:
+    """Deserialize a JSON document.
+
+    Args:
+        data: UTF-8 encoded JSON document (eg: the content of a response).
+
+    Returns:
+        The decoded JSON value.
+    """
+    return orjson.loads(data)
@@ -1,71 +1,102 @@
-"""Data objects used to manage test cycles."""
-
-import datetime
-
-from dataclasses import dataclass, field
-
-
-@dataclass
-class TestCycle:
-    """Represents an existing test cycle.
-
-    _See Also_:
-        [TestPlan][zfr.dataobjects.TestPlan]
-    """
-
-    created_by: str = field(default_factory=str)
-    """Username of the user that created the test cycle."""
-
-    created_on: datetime.datetime = None
-    """Date and time that the test cycle was created."""
-
-    description: str = field(default_factory=str)
-    """Brief description of the purpose of the test cycle."""
-
-    estimated_time: int = field(default_factory=int)
-    """Estimated time (in seconds) required to complete the test cycle."""
-
-    folder: str = field(default_factory=str)
-    """Folder used to logically group test cycles."""
-
-    issue_count: int = field(default_factory=int)
-    """Number of issues associated with the test cycle."""
-
-    issue_key: str = field(default_factory=str)
-    """Related Jira issue that the test cycle is associated with."""
-
-    key: str = field(default_factory=str)
-    """Test cycle key (eg: MYPROJECT-C123)."""
-
-    name: str = field(default_factory=str)
-    """Name of the test cycle."""
-
-    owner: str = field(default_factory=str)
-    """User that owns the test cycle."""
-
-    planned_end_date: datetime.datetime = None
-    """Date and time that the test cycle is expected to finish."""
-
-    planned_start_date: datetime.datetime = None
-    """Date and time that the test cycle is expected to commence."""
-
-    project_key: str = field(default_factory=str)
-    """Project key of the project that the test cycle belongs to (eg: MYPROJECT)."""
-
-    status: str = 'Draft'
-    """Test cycle status.
-
-    Valid options are:
-        * Not Executed
-        * In Progress
-        * Done
-    """
-
-    test_case_count: int = field(default_factory=int)
-    """Number of test cases associated with the test cycle."""
-
-    updated_by: str = field(default_factory=str)
-    """Username of the user that last updated the test cycle."""
-
-    updated_on: datetime.datetime = None
-    """Date and time that the test cycle was last updated."""
+# cython: language_level=3, infer_types=True
+"""Data objects used to manage test cycles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from zfr.dataobjects import ApiFields, _eq_on, _intern_status
+from zfr.dataobjects._codegen import build_from_api, build_to_api
+
+
+@dataclass(slots=True, eq=False)
+class TestCycle:
+    """Represents an existing test cycle.
+
+    _See Also_:
+        [TestPlan][zfr.dataobjects.TestPlan]
+    """
+
+    created_by: str = ''
+    """Username of the user that created the test cycle."""
+
+    created_on: str | None = None
+    """Date and time that the test cycle was created."""
+
+    description: str = ''
+    """Brief description of the purpose of the test cycle."""
+
+    estimated_time: int = 0
+    """Estimated time (in seconds) required to complete the test cycle."""
+
+    folder: str = ''
+    """Folder used to logically group test cycles."""
+
+    issue_count: int = 0
+    """Number of issues associated with the test cycle."""
+
+    issue_key: str = ''
+    """Related Jira issue that the test cycle is associated with."""
+
+    key: str = ''
+    """Test cycle key (eg: MYPROJECT-C123)."""
+
+    name: str = ''
+    """Name of the test cycle."""
+
+    owner: str = ''
+    """User that owns the test cycle."""
+
+    planned_end_date: str | None = None
+    """Date and time that the test cycle is expected to finish."""
+
+    planned_start_date: str | None = None
+    """Date and time that the test cycle is expected to commence."""
+
+    project_key: str = ''
+    """Project key of the project that the test cycle belongs to (eg: MYPROJECT)."""
+
+    status: str = 'Draft'
+    """Test cycle status.
+
+    Valid options are:
+        * Not Executed
+        * In Progress
+        * Done
+    """
+
+    test_case_count: int = 0
+    """Number of test cases associated with the test cycle."""
+
+    updated_by: str = ''
+    """Username of the user that last updated the test cycle."""
+
+    updated_on: str | None = None
+    """Date and time that the test cycle was last updated."""
+
+    __post_init__ = _intern_status
+
+    __eq__ = _eq_on('key')
+
+
+_TESTCYCLE_FIELDS: ApiFields = (
+    ('createdBy', 'created_by', None),
+    ('createdOn', 'created_on', None),
+    ('description', 'description', None),
+    ('estimatedTime', 'estimated_time', None),
+    ('folder', 'folder', None),
+    ('issueCount', 'issue_count', None),
+    ('issueKey', 'issue_key', None),
+    ('key', 'key', None),
+    ('name', 'name', None),
+    ('owner', 'owner', None),
+    ('plannedEndDate', 'planned_end_date', None),
+    ('plannedStartDate', 'planned_start_date', None),
+    ('projectKey', 'project_key', None),
+    ('status', 'status', None),
+    ('testCaseCount', 'test_case_count', None),
+    ('updatedBy', 'updated_by', None),
+    ('updatedOn', 'updated_on', None)
+)
+
+TestCycle.from_api = staticmethod(build_from_api(TestCycle, _TESTCYCLE_FIELDS))
+TestCycle.to_api = build_to_api(TestCycle, _TESTCYCLE_FIELDS)
@@ -1,123 +1,162 @@
-"""Data objects used to manage Zephyr folders."""
-
-from dataclasses import dataclass, field
-from enum import Enum
-
-
-class FolderType(str, Enum):
-    """Zephyr folder type.
-
-    _See Also_:
-        [Folder][zfr.dataobjects.Folder]
-    """
-
-    CASE = 'TEST_CASE'
-    """Indicates that the folder should be used to group test cases."""
-
-    CYCLE = 'TEST_RUN'
-    """Indicates that the folder should be used to group test cycles."""
-
-    PLAN = 'TEST_PLAN'
-    """Indicates that the folder should be used to group test plans."""
-
-    def __str__(self) -> str:
-        """Enum key value.
-
-        Returns:
-           The enum value expressed as a string.
-        """
-        return str(self.value)
-
-
-@dataclass
-class Folder:
-    """Represents a Zephyr folder.
-
-    _See Also_:
-        [FolderType][zfr.dataobjects.FolderType]
-    """
-
-    def __init__(
-        self,
-        id: int = 0,
-        name: str = None,
-        type: FolderType = FolderType.PLAN
-    ) -> None:
-        """Initialize a Folder object.
-
-        Args:
-            id: Unique id of the existing folder.
-            name: Name of the folder.
-            type: Type of test data associated with the folder (Test Plan,
-                Test Cycle or Test Case).
-        """
-        self.id = id
-        self.name = name if name.startswith('/') else f"/{name}"
-        self.type = type
-
-    id: int = field(default_factory=int)
-    """Unique id of the folder."""
-
-    name: str = field(default_factory=str)
-    """Folder name.
-
-    ???+ note "Naming Conventions"
-         The Zephyr API is a little inconsistent with the way that it handles
-         folder names. It expects the folder name to start with a forward slash
-         when creating the folder, but requires that it doesn't start with a
-         forward slash when updating the folder.
-
-         The CLI sub-commands will attempt to hide this inconsistency as best
-         as they can, to provide for a nicer user-experience.
-    """
-
-    type: FolderType = None
-    """The type of test information associated with the folder.
-
-    Valid options are:
-        * TEST_PLAN
-        * TEST_CYCLE
-        * TEST_CASE
-
-    _See Also_:
-        [FolderType][zfr.dataobjects.folder.FolderType]
-    """
-
-
-@dataclass
-class FolderCreate:
-    """Represents a new Zephyr folder.
-
-    _See Also_:
-        [FolderType][zfr.dataobjects.FolderType],
-        [Folder][zfr.dataobjects.FolderUpdate],
-        [FolderUpdate][zfr.dataobjects.FolderUpdate],
-    """
-
-    name: str = field(default_factory=str)
-    """Folder name.
-
-    ???+ note "Naming Conventions"
-         The Zephyr API is a little inconsistent with the way that it handles
-         folder names. It expects the folder name to start with a forward slash
-         when creating the folder, but requires that it doesn't start with a
-         forward slash when updating the folder.
-
-         The CLI sub-commands will attempt to hide this inconsistency as best
-         as they can, to provide for a nicer user-experience.
-    """
-
-    project_key: str = field(default_factory=str)
-    """Project key of the project that the folder will reside within."""
-
-    type: FolderType = None
-    """The type of test information associated with the folder.
-
-    Valid options are:
-        * TEST_PLAN
-        * TEST_CYCLE
-        * TEST_CASE
-
-    _See Also_:
-        [FolderType][zfr.dataobjects.folder.FolderType]
-    """
+# cython: language_level=3, infer_types=True
+"""Data objects used to manage Zephyr folders."""
+
+import sys
+
+from dataclasses import dataclass
+from typing import Final, Optional
+from zfr.dataobjects import ApiFields
+from zfr.dataobjects._codegen import build_from_api, build_to_api
+
+
+def _norm_folder_name(name: Optional[str]) -> Optional[str]:
+    """Ensure a folder name starts with a forward slash.
+
+    The result is interned, as folder names are typically drawn from a small
+    set, so folders with the same name share a single string.
+
+    Args:
+        name: Folder name.
+
+    Returns:
+        The normalised folder name, or ```None``` if no name was provided.
+    """
+    if name is None:
+        return None
+
+    return sys.intern(name if name.startswith('/') else '/' + name)
+
+
+class FolderType:
+    """Zephyr folder type.
+
+    The values are the plain strings expected by the Zephyr Scale API, so they
+    can be compared and serialized without any conversion.
+
+    _See Also_:
+        [Folder][zfr.dataobjects.Folder]
+    """
+
+    CASE: Final[str] = 'TEST_CASE'
+    """Indicates that the folder should be used to group test cases."""
+
+    CYCLE: Final[str] = 'TEST_RUN'
+    """Indicates that the folder should be used to group test cycles."""
+
+    PLAN: Final[str] = 'TEST_PLAN'
+    """Indicates that the folder should be used to group test plans."""
+
+
+@dataclass(slots=True)
+class Folder:
+    """Represents a Zephyr folder.
+
+    _See Also_:
+        [FolderType][zfr.dataobjects.FolderType]
+    """
+
+    id: int
+    """Unique id of the folder."""
+
+    name: str
+    """Folder name.
+
+    ???+ note "Naming Conventions"
+         The Zephyr API is a little inconsistent with the way that it handles
+         folder names. It expects the folder name to start with a forward slash
+         when creating the folder, but requires that it doesn't start with a
+         forward slash when updating the folder.
+
+         The CLI sub-commands will attempt to hide this inconsistency as best
+         as they can, to provide for a nicer user-experience.
+    """
+
+    type: str
+    """The type of test information associated with the folder.
+
+    Valid options are:
+        * TEST_PLAN
+        * TEST_CYCLE
+        * TEST_CASE
+
+    _See Also_:
+        [FolderType][zfr.dataobjects.folder.FolderType]
+    """
+
+    # dataclass won't replace an explicitly defined __init__, so this is the
+    # only constructor. The fields above are only declared so that they're
+    # slotted and included in the generated __repr__/__eq__.
+    def __init__(
+        self,
+        id: int = 0,
+        name: str = None,
+        type: str = FolderType.PLAN
+    ) -> None:
+        """Initialize a Folder object.
+
+        Args:
+            id: Unique id of the existing folder.
+            name: Name of the folder.
+            type: Type of test data associated with the folder (Test Plan,
+                Test Cycle or Test Case).
+        """
+        self.id = id
+        self.name = _norm_folder_name(name)
+        self.type = type
+
+
+@dataclass(slots=True)
+class FolderCreate:
+    """Represents a new Zephyr folder.
+
+    _See Also_:
+        [FolderType][zfr.dataobjects.FolderType],
+        [Folder][zfr.dataobjects.FolderUpdate],
+        [FolderUpdate][zfr.dataobjects.FolderUpdate],
+    """
+
+    name: str = ''
+    """Folder name.
+
+    ???+ note "Naming Conventions"
+         The Zephyr API is a little inconsistent with the way that it handles
+         folder names. It expects the folder name to start with a forward slash
+         when creating the folder, but requires that it doesn't start with a
+         forward slash when updating the folder.
+
+         The CLI sub-commands will attempt to hide this inconsistency as best
+         as they can, to provide for a nicer user-experience.
+    """
+
+    project_key: str = ''
+    """Project key of the project that the folder will reside within."""
+
+    type: str = None
+    """The type of test information associated with the folder.
+
+    Valid options are:
+        * TEST_PLAN
+        * TEST_CYCLE
+        * TEST_CASE
+
+    _See Also_:
+        [FolderType][zfr.dataobjects.folder.FolderType]
+    """
+
+
+_FOLDER_FIELDS: ApiFields = (
+    ('id', 'id', None),
+    ('name', 'name', None),
+    ('type', 'type', None)
+)
+
+_FOLDER_CREATE_FIELDS: ApiFields = (
+    ('name', 'name', None),
+    ('projectKey', 'project_key', None),
+    ('type', 'type', None)
+)
+
+Folder.from_api = staticmethod(build_from_api(Folder, _FOLDER_FIELDS))
+Folder.to_api = build_to_api(Folder, _FOLDER_FIELDS)
+FolderCreate.from_api = staticmethod(build_from_api(FolderCreate, _FOLDER_CREATE_FIELDS))
+FolderCreate.to_api = build_to_api(FolderCreate, _FOLDER_CREATE_FIELDS)
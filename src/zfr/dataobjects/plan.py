@@ -1,217 +1,326 @@
-"""Data objects used to manage test plans."""
-
-import datetime
-
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-from zfr.dataobjects import Comment
-from zfr.dataobjects.cycle import TestCycle
-
-
-@dataclass(frozen=True)
-class Attachment:
-    """Represents a file attachment on a test plan, cycle or case.
-
-    _See Also_:
-        [Plan][zfr.dataobjects.plan.Plan]
-    """
-
-    id: int = field(default_factory=int)
-    """Unique identifier for the attachment."""
-
-    url: str = field(default_factory=str)
-    """Url that the attachment can be downloaded from."""
-
-    filename: str = field(default_factory=str)
-    """Name of the attached file."""
-
-    filesize: int = field(default_factory=int)
-    """Attachment file size (in bytes)."""
-
-
-@dataclass
-class Plan:
-    """Represents an existing test plan.
-
-    _See Also_:
-        [Attachment][zfr.dataobjects.plan.Attachment],
-        [Comment][zfr.dataobjects.Comment],
-        [TestCycle][zfr.dataobjects.cycle.TestCycle],
-        [PlanCreate][zfr.dataobjects.plan.PlanCreate],
-        [PlanUpdate][zfr.dataobjects.plan.PlanUpdate]
-    """
-
-    attachments: Optional[List[Attachment]]= field(default_factory=list)
-    """List of attachments added to the test plan."""
-
-    comments: Optional[List[Comment]] = field(default_factory=list)
-    """List of comments added by users."""
-
-    created_by: str = field(default_factory=str)
-    """Username of the user that created the plan."""
-
-    created_on: datetime.datetime = None
-    """Date and time that the plan was created."""
-
-    custom_fields: Optional[Dict[str, str]] = field(default_factory=dict)
-    """Custom fields associated with the plan, used to additional metadata."""
-
-    folder: str = field(default_factory=str)
-    """Folder used to logically group plans."""
-
-    issue_links: Optional[List[str]] = field(default_factory=list)
-    """Jira issues that are associated with the plan."""
-
-    key: str = field(default_factory=str)
-    """Unique key for the plan. (eg: MYPROJECT-P29)."""
-
-    labels: Optional[List[str]] = field(default_factory=list)
-    """Additional labels that can be used to filter plans."""
-
-    name: str = field(default_factory=str)
-    """Name of the plan."""
-
-    objective: str = field(default_factory=str)
-    """Plan objective(s).
-
-    ???+ note "HTML"
-         This field can accept basic HTML to format test (bold, italic,
-         underline, links, paragraphs).
-    """
-
-    owner: str = field(default_factory=str)
-    """Username of the user responsible for maintaining the test plan."""
-
-    project_key: str = field(default_factory=str)
-    """Project key oof the jira project the plan relates to. (eg: MYPROJECT)."""
-
-    status: str = field(default_factory=str)
-    """Indicates whether the test plan has been approved for use.
-
-    Valid values are:
-        - Draft
-        - Approved
-        - Deprecated
-    """
-
-    test_runs: Optional[List[TestCycle]] = field(default_factory=list)
-    """Historical list of test cycles executed against the test plan."""
-
-    updated_by: str = field(default_factory=str)
-    """Username of the user that last updated the test plan."""
-
-    updated_on: datetime.datetime = None
-    """Date and time that the test plan was last updated."""
-
-
-@dataclass
-class PlanCreate:
-    """Used to create a new test plan.
-
-    _See Also_:
-        [Comment][zfr.dataobjects.Comment],
-        [TestCycle][zfr.dataobjects.cycle.TestCycle],
-        [Plan][zfr.dataobjects.plan.Plan],
-        [PlanUpdate][zfr.dataobjects.plan.PlanUpdate]
-    """
-
-    attachments: Optional[List[str]] = field(default_factory=list)
-    """List of attachments added to the test plan."""
-
-    custom_fields: Optional[Dict[str, str]] = field(default_factory=dict)
-    """Custom fields associated with the plan, used to additional metadata."""
-
-    folder: str = field(default_factory=str)
-    """Folder used to logically group plans."""
-
-    issue_links: Optional[List[str]] = field(default_factory=list)
-    """Jira issues that are associated with the plan."""
-
-    labels: Optional[List[str]] = field(default_factory=list)
-    """Additional labels that can be used to filter plans."""
-
-    name: str = field(default_factory=str)
-    """Name of the plan."""
-
-    objective: str = field(default_factory=str)
-    """Plan objective(s).
-
-    ???+ note "HTML"
-         This field can accept basic HTML to format test (bold, italic,
-         underline, links, paragraphs).
-    """
-
-    owner: str = field(default_factory=str)
-    """Username of the user responsible for maintaining the test plan."""
-
-    project_key: str = field(default_factory=str)
-    """Project key oof the jira project the plan relates to. (eg: MYPROJECT)."""
-
-    status: str = field(default_factory=str)
-    """Indicates whether the test plan has been approved for use.
-
-    Valid values are:
-        - Draft
-        - Approved
-        - Deprecated
-    """
-
-    test_run_keys: Optional[List[str]] = field(default_factory=list)
-    """Historical list of test cycles executed against the test plan."""
-
-
-@dataclass
-class PlanUpdate:
-    """Used to update an existing test plan.
-
-    _See Also_:
-        [Attachment][zfr.dataobjects.plan.Attachment],
-        [Comment][zfr.dataobjects.Comment],
-        [TestCycle][zfr.dataobjects.cycle.TestCycle],
-        [Plan][zfr.dataobjects.plan.Plan],
-        [PlanCreate][zfr.dataobjects.plan.PlanCreate]
-    """
-
-    attachments: Optional[List[str]] = field(default_factory=list)
-    """List of attachments added to the test plan."""
-
-    custom_fields: Optional[Dict[str, str]] = field(default_factory=dict)
-    """Custom fields associated with the plan, used to additional metadata."""
-
-    folder: str = field(default_factory=str)
-    """Folder used to logically group plans."""
-
-    issue_links: Optional[List[str]] = field(default_factory=list)
-    """Jira issues that are associated with the plan."""
-
-    key: str = field(default_factory=str)
-    """Test plan key (eg: MYPROJECT-P24)."""
-
-    labels: Optional[List[str]] = field(default_factory=list)
-    """Additional labels that can be used to filter plans."""
-
-    name: str = field(default_factory=str)
-    """Name of the plan."""
-
-    objective: str = field(default_factory=str)
-    """Plan objective(s).
-
-    ???+ note "HTML"
-         This field can accept basic HTML to format test (bold, italic,
-         underline, links, paragraphs).
-    """
-
-    owner: str = field(default_factory=str)
-    """Username of the user responsible for maintaining the test plan."""
-
-    status: str = field(default_factory=str)
-    """Indicates whether the test plan has been approved for use.
-
-    Valid values are:
-        - Draft
-        - Approved
-        - Deprecated
-    """
-
-    test_runs: Optional[List[str]] = field(default_factory=list)
-    """Historical list of test cycles executed against the test plan."""
+# cython: language_level=3, infer_types=True
+"""Data objects used to manage test plans.
+
+List fields default to a shared empty tuple rather than a new list per
+instance, so assign a list before adding items to an empty field.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from zfr.dataobjects import ApiFields, Comment, ListOf, _eq_on, _intern_status
+from zfr.dataobjects._codegen import build_from_api, build_to_api
+from zfr.dataobjects.cycle import TestCycle
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Attachment:
+    """Represents a file attachment on a test plan, cycle or case.
+
+    _See Also_:
+        [Plan][zfr.dataobjects.plan.Plan]
+    """
+
+    id: int = 0
+    """Unique identifier for the attachment."""
+
+    url: str = ''
+    """Url that the attachment can be downloaded from."""
+
+    filename: str = ''
+    """Name of the attached file."""
+
+    filesize: int = 0
+    """Attachment file size (in bytes)."""
+
+    __eq__ = _eq_on('id')
+
+    def __hash__(self) -> int:
+        """Hash the attachment on its id."""
+        return hash(self.id)
+
+
+@dataclass(slots=True, eq=False)
+class Plan:
+    """Represents an existing test plan.
+
+    _See Also_:
+        [Attachment][zfr.dataobjects.plan.Attachment],
+        [Comment][zfr.dataobjects.Comment],
+        [TestCycle][zfr.dataobjects.cycle.TestCycle],
+        [PlanCreate][zfr.dataobjects.plan.PlanCreate],
+        [PlanUpdate][zfr.dataobjects.plan.PlanUpdate]
+    """
+
+    attachments: Sequence[Attachment] = ()
+    """List of attachments added to the test plan."""
+
+    comments: Sequence[Comment] = ()
+    """List of comments added by users."""
+
+    created_by: str = ''
+    """Username of the user that created the plan."""
+
+    created_on: str | None = None
+    """Date and time that the plan was created."""
+
+    custom_fields: dict[str, str] | None = field(default_factory=dict)
+    """Custom fields associated with the plan, used to additional metadata."""
+
+    folder: str = ''
+    """Folder used to logically group plans."""
+
+    issue_links: Sequence[str] = ()
+    """Jira issues that are associated with the plan."""
+
+    key: str = ''
+    """Unique key for the plan. (eg: MYPROJECT-P29)."""
+
+    labels: Sequence[str] = ()
+    """Additional labels that can be used to filter plans."""
+
+    name: str = ''
+    """Name of the plan."""
+
+    objective: str = ''
+    """Plan objective(s).
+
+    ???+ note "HTML"
+         This field can accept basic HTML to format test (bold, italic,
+         underline, links, paragraphs).
+    """
+
+    owner: str = ''
+    """Username of the user responsible for maintaining the test plan."""
+
+    project_key: str = ''
+    """Project key oof the jira project the plan relates to. (eg: MYPROJECT)."""
+
+    status: str = ''
+    """Indicates whether the test plan has been approved for use.
+
+    Valid values are:
+        - Draft
+        - Approved
+        - Deprecated
+    """
+
+    test_runs: Sequence[TestCycle] = ()
+    """Historical list of test cycles executed against the test plan."""
+
+    updated_by: str = ''
+    """Username of the user that last updated the test plan."""
+
+    updated_on: str | None = None
+    """Date and time that the test plan was last updated."""
+
+    __post_init__ = _intern_status
+
+    __eq__ = _eq_on('key')
+
+    @property
+    def cycles_by_status(self) -> dict[str, list[TestCycle]]:
+        """Test cycles executed against the plan, grouped by their status."""
+        result: dict[str, list[TestCycle]] = {}
+        for cycle in self.test_runs or ():
+            result.setdefault(cycle.status, []).append(cycle)
+
+        return result
+
+    @property
+    def done_cycle_count(self) -> int:
+        """Number of test cycles executed against the plan that are done."""
+        return sum(1 for cycle in self.test_runs or () if cycle.status == 'Done')
+
+    @property
+    def folders(self) -> frozenset[str]:
+        """Folders that the test cycles executed against the plan belong to."""
+        return frozenset(cycle.folder for cycle in self.test_runs or () if cycle.folder)
+
+    @property
+    def total_estimated_time(self) -> int:
+        """Estimated time (in seconds) required to complete every test cycle."""
+        return sum(cycle.estimated_time for cycle in self.test_runs or ())
+
+
+@dataclass(slots=True)
+class PlanCreate:
+    """Used to create a new test plan.
+
+    _See Also_:
+        [Comment][zfr.dataobjects.Comment],
+        [TestCycle][zfr.dataobjects.cycle.TestCycle],
+        [Plan][zfr.dataobjects.plan.Plan],
+        [PlanUpdate][zfr.dataobjects.plan.PlanUpdate]
+    """
+
+    attachments: Sequence[str] = ()
+    """List of attachments added to the test plan."""
+
+    custom_fields: dict[str, str] | None = field(default_factory=dict)
+    """Custom fields associated with the plan, used to additional metadata."""
+
+    folder: str = ''
+    """Folder used to logically group plans."""
+
+    issue_links: Sequence[str] = ()
+    """Jira issues that are associated with the plan."""
+
+    labels: Sequence[str] = ()
+    """Additional labels that can be used to filter plans."""
+
+    name: str = ''
+    """Name of the plan."""
+
+    objective: str = ''
+    """Plan objective(s).
+
+    ???+ note "HTML"
+         This field can accept basic HTML to format test (bold, italic,
+         underline, links, paragraphs).
+    """
+
+    owner: str = ''
+    """Username of the user responsible for maintaining the test plan."""
+
+    project_key: str = ''
+    """Project key oof the jira project the plan relates to. (eg: MYPROJECT)."""
+
+    status: str = ''
+    """Indicates whether the test plan has been approved for use.
+
+    Valid values are:
+        - Draft
+        - Approved
+        - Deprecated
+    """
+
+    test_run_keys: Sequence[str] = ()
+    """Historical list of test cycles executed against the test plan."""
+
+    __post_init__ = _intern_status
+
+
+@dataclass(slots=True)
+class PlanUpdate:
+    """Used to update an existing test plan.
+
+    _See Also_:
+        [Attachment][zfr.dataobjects.plan.Attachment],
+        [Comment][zfr.dataobjects.Comment],
+        [TestCycle][zfr.dataobjects.cycle.TestCycle],
+        [Plan][zfr.dataobjects.plan.Plan],
+        [PlanCreate][zfr.dataobjects.plan.PlanCreate]
+    """
+
+    attachments: Sequence[str] = ()
+    """List of attachments added to the test plan."""
+
+    custom_fields: dict[str, str] | None = field(default_factory=dict)
+    """Custom fields associated with the plan, used to additional metadata."""
+
+    folder: str = ''
+    """Folder used to logically group plans."""
+
+    issue_links: Sequence[str] = ()
+    """Jira issues that are associated with the plan."""
+
+    key: str = ''
+    """Test plan key (eg: MYPROJECT-P24)."""
+
+    labels: Sequence[str] = ()
+    """Additional labels that can be used to filter plans."""
+
+    name: str = ''
+    """Name of the plan."""
+
+    objective: str = ''
+    """Plan objective(s).
+
+    ???+ note "HTML"
+         This field can accept basic HTML to format test (bold, italic,
+         underline, links, paragraphs).
+    """
+
+    owner: str = ''
+    """Username of the user responsible for maintaining the test plan."""
+
+    status: str = ''
+    """Indicates whether the test plan has been approved for use.
+
+    Valid values are:
+        - Draft
+        - Approved
+        - Deprecated
+    """
+
+    test_runs: Sequence[str] = ()
+    """Historical list of test cycles executed against the test plan."""
+
+    __post_init__ = _intern_status
+
+
+_ATTACHMENT_FIELDS: ApiFields = (
+    ('id', 'id', None),
+    ('url', 'url', None),
+    ('filename', 'filename', None),
+    ('filesize', 'filesize', None)
+)
+
+_PLAN_FIELDS: ApiFields = (
+    ('attachments', 'attachments', ListOf(Attachment)),
+    ('comments', 'comments', ListOf(Comment)),
+    ('createdBy', 'created_by', None),
+    ('createdOn', 'created_on', None),
+    ('customFields', 'custom_fields', None),
+    ('folder', 'folder', None),
+    ('issueLinks', 'issue_links', None),
+    ('key', 'key', None),
+    ('labels', 'labels', None),
+    ('name', 'name', None),
+    ('objective', 'objective', None),
+    ('owner', 'owner', None),
+    ('projectKey', 'project_key', None),
+    ('status', 'status', None),
+    ('testRuns', 'test_runs', ListOf(TestCycle)),
+    ('updatedBy', 'updated_by', None),
+    ('updatedOn', 'updated_on', None)
+)
+
+_PLAN_CREATE_FIELDS: ApiFields = (
+    ('attachments', 'attachments', None),
+    ('customFields', 'custom_fields', None),
+    ('folder', 'folder', None),
+    ('issueLinks', 'issue_links', None),
+    ('labels', 'labels', None),
+    ('name', 'name', None),
+    ('objective', 'objective', None),
+    ('owner', 'owner', None),
+    ('projectKey', 'project_key', None),
+    ('status', 'status', None),
+    ('testRunKeys', 'test_run_keys', None)
+)
+
+_PLAN_UPDATE_FIELDS: ApiFields = (
+    ('attachments', 'attachments', None),
+    ('customFields', 'custom_fields', None),
+    ('folder', 'folder', None),
+    ('issueLinks', 'issue_links', None),
+    ('key', 'key', None),
+    ('labels', 'labels', None),
+    ('name', 'name', None),
+    ('objective', 'objective', None),
+    ('owner', 'owner', None),
+    ('status', 'status', None),
+    ('testRuns', 'test_runs', None)
+)
+
+Attachment.from_api = staticmethod(build_from_api(Attachment, _ATTACHMENT_FIELDS))
+Attachment.to_api = build_to_api(Attachment, _ATTACHMENT_FIELDS)
+Plan.from_api = staticmethod(build_from_api(Plan, _PLAN_FIELDS))
+Plan.to_api = build_to_api(Plan, _PLAN_FIELDS)
+PlanCreate.from_api = staticmethod(build_from_api(PlanCreate, _PLAN_CREATE_FIELDS))
+PlanCreate.to_api = build_to_api(PlanCreate, _PLAN_CREATE_FIELDS)
+PlanUpdate.from_api = staticmethod(build_from_api(PlanUpdate, _PLAN_UPDATE_FIELDS))
+PlanUpdate.to_api = build_to_api(PlanUpdate, _PLAN_UPDATE_FIELDS)
@@ -1,10 +1,10 @@
-"""ZFR exceptions."""
-
-
-class AuthorizationError(PermissionError):
-    """Raised when the user is not permitted to perform an action."""
-
-    def __init__(self, message: str) -> None:
-        """Initialize a new AuthorizationError object."""
-        self.message = message
-        super().__init__(self.message)
+"""ZFR exceptions."""
+
+
+class AuthorizationError(PermissionError):
+    """Raised when the user is not permitted to perform an action."""
+
+    @property
+    def message(self) -> str:
+        """Description of the action that the user isn't permitted to perform."""
+        return self.args[0] if self.args else ''
@@ -1,591 +1,882 @@
-"""Helper classes used to manage Zephyr Scale test configurations."""
-
-from dataclasses import asdict
-from http import HTTPStatus
-from requests import Response
-from requests_toolbelt import sessions
-from typing import Dict, List, Optional
-from urllib3.util.retry import Retry
-from zfr.dataobjects.folder import Folder, FolderCreate, FolderType
-from zfr.dataobjects.plan import Attachment, Plan, PlanCreate, PlanUpdate
-from zfr.exception import AuthorizationError
-from zfr.utils import dict_to_camel, dict_to_snake, TimeoutHTTPAdapter
-
-
-class FolderManager:
-    """Manage Zephyr Scale folders."""
-
-    def __init__(self, url: str, api_suffix: str, username: str, password: str) -> None:
-        """Initialize a new FolderManager object.
-
-        Args:
-            url: Jira URL.
-            api_suffix: Content path used to access the Zephyr Scale REST API.
-            username: Username used to make authenticated API calls.
-            password: Password used to make authenticated API calls.
-        """
-        self._url = url
-        self._api_suffix = api_suffix
-
-        # Set a base url, auth credentials, a retry strategy, request timeout
-        # value, and add a single handler for all authentication/internal 
-        # server errors so we don't need to keep passing the same information
-        # all over the place.
-        self._session = sessions.BaseUrlSession(base_url=url)
-        self._session.auth = (username, password)
-        self._session.hooks['response'] = self._response_hook
-
-        retries = Retry(
-            total=5,
-            backoff_factor=0.1,
-            status_forcelist=[500, 502, 503, 504]
-        )
-
-        self._session.mount('https://', TimeoutHTTPAdapter(max_retries=retries, timeout=90))
-
-    def create(self, folder: FolderCreate) -> Folder:
-        """Create a new folder.
-
-        Args:
-            folder: Folder to be created.
-
-        Returns:
-            The created folder.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                create folders.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Folder][zfr.dataobjects.folder.Folder]
-        """
-        result: Optional[Folder] = None
-        endpoint = f"/{self._api_suffix}/folder"
-
-        data = dict_to_camel(asdict(folder))
-
-        # zephyr requires the folder name to start with a forward slash when
-        # creating folders, but NOT start with a forward slash when updating
-        # a folder. We manage the inconsistency here to make things easier for
-        # users.
-        if not data['name'].startswith('/'):
-            data['name'] = f"/{data['name']}"
-
-        print(data)
-
-        resp = self._session.post(endpoint, json=data)
-
-        if resp.status_code == HTTPStatus.CREATED:
-            resp_data = resp.json()
-            result = Folder(
-                id=resp_data['id'],
-                name=folder.name.lstrip('/'),
-                type=folder.type
-            )
-        elif resp.status_code == HTTPStatus.BAD_REQUEST:
-            resp_data = resp.json()
-            raise RuntimeError(', '.join(resp_data['errorMessages']))
-
-        return result
-
-    def update(self, folder: Folder) -> Folder:
-        """Update an existing folder.
-
-        Args:
-            folder: The modified folder.
-
-        Returns:
-            The updated Folder.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                modify folders.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Folder][zfr.dataobjects.folder.Folder]
-        """
-        endpoint = f"/{self._api_suffix}/folder/{folder.id}"
-
-        data = dict_to_camel(asdict(folder))
-        data['name'] = data['name'].lstrip('/')
-        data.pop('id')
-        data.pop('type')
-
-        # remove any null attributes so we don't delete existing data
-        new_dict = {key: value for key, value in data.items() if value}
-
-        resp = self._session.put(endpoint, json=new_dict)
-
-        if resp.status_code == HTTPStatus.OK:
-            return folder
-        elif resp.status_code == HTTPStatus.BAD_REQUEST:
-            resp_data = resp.json()
-            raise RuntimeError(', '.join(resp_data['errorMessages']))
-
-
-    def _response_hook(self, response, *args, **kwargs) -> None:
-        """Request hook used to centrally manage handle HTTP errors.
-
-        This is used to response to authoriation or server-side errors
-        in one place, to avoid code duplication and ensure consistent
-        error handling behaviour.
-
-        Args:
-            response: HTTP response recieved from the remote host.
-            args: HTTP response arguments.
-            kwargs: Additional custom args.
-        """
-        if response.status_code in [HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN]:
-            raise AuthorizationError(f'Client does not have permission to perform this action. {response.request.method} {response.request.url}')
-        elif response.status_code > HTTPStatus.FORBIDDEN:
-            err_msg = (
-                'Unexpected response recieved from the remote server '
-                f'{response.status_code} {response.request.method} '
-                f'{response.request.url} {response.text}'
-            )
-            raise RuntimeError(err_msg)
-
-
-class PlanManager:
-    """Manage test plans."""
-
-    def __init__(self, url: str, api_suffix: str, username: str, password: str) -> None:
-        """Initialize a PlanManager object.
-
-        Args:
-            url: Jira URL.
-            api_suffix: Content path used to access the Zephyr Scale REST API.
-            username: Username used to make authenticated API calls.
-            password: Password used to make authenticated API calls.
-        """
-        self._url = url
-        self._api_suffix = api_suffix
-
-        # Set a base url, auth credentials, a retry strategy, request timeout
-        # value, and add a single handler for all authentication/internal 
-        # server errors so we don't need to keep passing the same information
-        # all over the place.
-        self._session = sessions.BaseUrlSession(base_url=url)
-        self._session.auth = (username, password)
-        self._session.hooks['response'] = self._response_hook
-
-        retries = Retry(
-            total=5,
-            backoff_factor=0.1,
-            status_forcelist=[500, 502, 503, 504]
-        )
-
-        self._session.mount('https://', TimeoutHTTPAdapter(max_retries=retries, timeout=90))
-
-    def create(self, plan: PlanCreate) -> Optional[Plan]:
-        """Create a new test plan.
-
-        Args:
-            plan: The plan to be created.
-
-        Returns:
-            The newly created plan.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                create plans.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        result: Optional[Plan] = None
-
-        # The Zephyr API will throw an error if you try to assign a
-        # non-existent folder to a plan, so we try to catch it, create
-        # the missing folder, then re-attempt to create the plan before
-        # giving up.
-
-        resp = self._create_plan(plan)
-
-        if resp.status_code == HTTPStatus.CREATED:
-            resp_data = resp.json()
-            result = self.get(resp_data['key'])
-        elif resp.status_code == HTTPStatus.BAD_REQUEST:
-            result = self._handle_creation_error(plan, resp.json())
-            if not result:
-                raise RuntimeError(f"Failed to create  plan {plan.name}")
-
-        # If the plan was created, upload the attachments, and retrieve the
-        # plan again to get the updated metadata containing the attachment
-        # identifiers.
-        if result and plan.attachments:
-            self._upload_attachments(result.key, plan.attachments)
-            result = self.get(result.key)
-
-        return result
-
-    def delete(self, key: str) -> Optional[Plan]:
-        """Delete an existing test plan.
-
-        Args:
-            key: The plan to be deleted.
-
-        Returns:
-            Details of the deleted plan.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                delete plans.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        # exit early if the plan doesn't exist. Avoids making un-necessary
-        # api calls.
-        result: Optional[Plan] = self.get(key)
-        if not result:
-            return None
-
-        endpoint = f"/{self._api_suffix}/testplan/{key}"
-
-        resp = self._session.delete(endpoint)
-
-        if resp.status_code == HTTPStatus.NO_CONTENT or resp.status_code == HTTPStatus.NOT_FOUND:
-            return result
-
-    def get(self, key: str, fields: Optional[List[str]] = None) -> Optional[Plan]:
-        """Get an existing plan.
-
-        Args:
-            key: The plan to be retrieved.
-            fields: Optionally limit the fieldsto be retrieved, to improve performance.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                retrieve plans.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        result = None
-
-        endpoint = f"{self._api_suffix}/testplan/{key}"
-        if fields:
-            endpoint += f"?fields={','.join(fields)}"
-                
-        resp = self._session.get(endpoint)        
-
-        if resp.status_code == HTTPStatus.OK:
-            resp_data = dict_to_snake(resp.json())            
-            result = Plan(**resp_data)
-        elif resp.status_code == HTTPStatus.NOT_FOUND:
-            result = None
-
-        # If the plan was created, upload the attachments, and retrieve the
-        # plan again to get the updated metadata containing the attachment
-        # identifiers.
-        if result:
-            result.attachments = self.get_attachments(result.key)
-
-        return result
-
-    def get_attachments(self, key: str) -> Optional[List[Attachment]]:
-        """Get the list of file attachments on an existing plan.
-
-        Args:
-            key: Plan key.
-
-        Returns:
-           A list of attachments associated with the plan, or ```None``` if a
-           plan with the given key could not be found.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                retrieve attachments.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Attachment][zfr.dataobjects.Attachment]
-        """
-        result: Optional[List[Attachment]] = []
-
-        endpoint = f"{self._api_suffix}/testplan/{key}/attachments"
-
-        resp = self._session.get(endpoint)
-
-        if resp.status_code == HTTPStatus.OK:
-            resp_data = dict_to_snake(resp.json())
-            result = [Attachment(**x) for x in resp_data]
-        elif resp.status_code == HTTPStatus.NOT_FOUND:
-            result = None
-        
-        return result
-
-    def update(self, plan: PlanUpdate) -> Optional[Plan]:
-        """Update an existing plan.
-
-        Args:
-            plan: The modified plan.
-
-        Returns:
-           The updated plan, or None if a plan with a matching key could not
-           be found.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                modify plans.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        result: Optional[Plan] = self.get(plan.key)
-        if not result:
-            raise RuntimeError(f"No such plan - {plan.key}.")
-
-        # The Zephyr API will throw an error if you try to assign a
-        # non-existent folder to a plan, so we try to catch it, create
-        # the missing folder, then re-attempt to create the plan before
-        # giving up.
-        resp = self._update_plan(plan)
-
-        if resp.status_code == HTTPStatus.OK:
-            result = result
-        elif resp.status_code == HTTPStatus.BAD_REQUEST:
-            result = self._handle_update_error(result.project_key, plan, resp.json())
-            if not result:
-                raise RuntimeError(f"Failed to update {plan.name}.")
-
-        # If the plan was created, upload the attachments, and retrieve the
-        # plan again to get the updated metadata containing the attachment
-        # identifiers.
-        if result and plan.attachments:
-            self._upload_attachments(plan.key, plan.attachments)
-            result = self.get(result.key)
-
-        return result
-
-    def _create_folder(self, folder: FolderCreate) -> Optional[Folder]:
-        """Create a new folder for logically grouping test plans.
-
-        Args:
-            folder: The folder to be created.
-
-        Returns:
-            A Folder object containing the folder configuration details.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                create folders.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Folder][zfr.dataobjects.plan.Folder]
-        """
-        result: Optional[Folder] = None
-
-        folder_dict = dict_to_camel(asdict(folder))
-
-        # zephyr requires the folder name to start with a forward slash when
-        # creating folders, but NOT start with a forward slash when updating
-        # a folder. We manage the inconsistency here to make things easier for
-        # users.
-        if not folder_dict['name'].startswith('/'):
-            folder_dict['name'] = f"/{folder_dict['name']}"
-
-        endpoint = f"{self._api_suffix}/folder"
-
-        resp = self._session.post(endpoint, json=folder_dict)
-
-        if resp.status_code == HTTPStatus.CREATED:
-            resp_data = resp.json()
-            result = Folder(
-                id=resp_data['id'],
-                name=folder.name,
-                type=folder.type
-            )
-        elif resp.status_code == HTTPStatus.BAD_REQUEST:
-            resp_data = resp.json()
-            raise RuntimeError(', '.join(resp_data['errorMessages']))
-
-        return result
-
-    def _create_plan(self, plan: PlanCreate) -> Response:
-        """Create a new plan.
-
-        Args:
-            plan: The plan to be created.
-
-        Returns:
-            A Response object with details of whether the plan creation was
-            successful or not.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        plan_dict = dict_to_camel(asdict(plan))
-
-        if 'attachments' in plan_dict:
-            plan_dict.pop('attachments')
-
-        if plan_dict['folder'] and not plan_dict['folder'].startswith('/'):
-            plan_dict['folder'] = f"/{plan_dict['folder']}"
-
-        endpoint = f"{self._api_suffix}/testplan/"
-        return self._session.post(endpoint, json=plan_dict)
-
-    def _handle_creation_error(self, plan: PlanCreate, resp_data: Dict) -> Optional[Plan]:
-        """Attempt to gracefully handle errors when create a new plan.
-
-        Args:
-            plan: Plan to be created.
-            resp_data: HTTP response object containing the error details.
-
-        Returns:
-            A Response object with details of whether the plan creation was
-            successful or not.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        result: Optional[Plan] = None
-
-        if any("was not found for field folder" in x for x in resp_data['errorMessages']):
-            new_folder = FolderCreate(
-                project_key=plan.project_key,
-                name=plan.folder,
-                type=FolderType.PLAN
-            )
-            created_folder: Optional[Folder] = self._create_folder(new_folder)
-
-            if created_folder:
-                result = self.create(plan)
-
-        return result
-
-    def _handle_update_error(self, project_key: str, plan: PlanUpdate, resp_data: Dict) -> Optional[Plan]:
-        """Attempt to gracefully handle errors when updating an existing plan.
-
-        Args:
-            project_key: Project that the plan belongs to.
-            plan: The modified Plan.
-            resp_data: HTTP response object containing the error details.
-
-        Returns:
-            A Response object with details of whether the plan was successfully
-            updated.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        result: Optional[Plan] = None
-
-        if any("was not found for field folder" in x for x in resp_data['errorMessages']):
-            new_folder = FolderCreate(
-                project_key=project_key,
-                name=plan.folder,
-                type=FolderType.PLAN
-            )
-            created_folder: Optional[Folder] = self._create_folder(new_folder)
-
-            if created_folder:
-                result = self.update(plan)
-
-        return result
-
-    def _response_hook(self, response, *args, **kwargs) -> None:
-        """Request hook used to centrally manage handle HTTP errors.
-
-        This is used to response to authoriation or server-side errors
-        in one place, to avoid code duplication and ensure consistent
-        error handling behaviour.
-
-        Args:
-            response: HTTP response recieved from the remote host.
-            args: HTTP response arguments.
-            kwargs: Additional custom args.
-        """
-        if response.status_code in [HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN]:
-            raise AuthorizationError(f'Client does not have permission to perform this action. {response.request.method} {response.request.url}')
-        elif response.status_code > HTTPStatus.FORBIDDEN:
-            err_msg = (
-                'Unexpected response recieved from the remote server '
-                f'{response.status_code} {response.request.method} '
-                f'{response.request.url} {response.text}'
-            )
-            raise RuntimeError(err_msg)
-
-    def _update_plan(self, plan: PlanUpdate) -> Response:
-        """Update an existing plan.
-
-        Args:
-            plan: The modified plan.
-
-        Returns:
-            A Response object with details of whether the plan was successfully
-            updated.
-
-        _See Also_:
-            [Plan][zfr.dataobjects.plan.Plan]
-        """
-        existing: Optional[Plan] = self.get(plan.key)
-
-        if not existing:
-            raise RuntimeError(f"No such plan - {plan.key}.")
-
-        # get the status from the existing plan if it wasn't changed.
-        if not plan.status:
-            plan.status = existing.status
-
-        plan_dict = dict_to_camel(asdict(plan))
-
-        # to make it easier to work with Zephyr, the data object has some
-        # additional properties that aren't used by the REST API, so we
-        # need to remove them prior to calling the update endpoint.
-        remove_keys = ['key', 'attachments']
-        for key in remove_keys:
-            plan_dict.pop(key)
-
-        # fix inconsistency with the way the Zephyr Scale API handles folder
-        # names
-        if plan_dict['folder'] and not plan_dict['folder'].startswith('/'):
-            plan_dict['folder'] = f"/{plan_dict['folder']}"
-
-        # remove empty fields so we don't accidentally over-write data
-        new_dict = {key: value for key, value in plan_dict.items() if value}
-
-        endpoint = f"{self._api_suffix}/testplan/{plan.key}"
-
-        resp = self._session.put(endpoint, json=new_dict)
-
-        return resp
-
-    def _upload_attachments(self, key: str, attachments: List[str]) -> None:
-        """Upload one or more attachments to a test plan.
-
-        Args:
-            key: Plan key (eg: MYPROJECT-P123).
-            attachments: List of attachments to be uploaded.
-
-        Raises:
-            AuthorizationError: If the client does not have permission to
-                create folders.
-            RuntimeError: If the Zephyr API returns an unexpected error.
-
-        _See Also_:
-            [Attachment][zfr.dataobjects.Attachment]
-        """
-        endpoint = f"{self._api_suffix}/testplan/{key}/attachments"
-
-        for attachment in attachments:
-            with open(attachment, 'rb') as infile:
-                upload_data = {'file': infile}
-
-                resp = self._session.post(endpoint, files=upload_data)
-
-                if resp.status_code != HTTPStatus.CREATED:
-                    err_msg = (
-                        f"Recieved HTTP response {resp.status_code} "
-                        f"attaching {attachment} to {key}."
-                    )
-                    raise RuntimeError(err_msg)
+"""Helper classes used to manage Zephyr Scale test configurations."""
+
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import replace
+from functools import partial
+from http import HTTPStatus
+from requests import Response
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder, sessions
+from typing import Dict, List, Optional, Tuple, Union
+from urllib3.util.retry import Retry
+from zfr.dataobjects._json import dumps, loads
+from zfr.dataobjects.folder import Folder, FolderCreate, FolderType
+from zfr.dataobjects.plan import Attachment, Plan, PlanCreate, PlanUpdate
+from zfr.exception import AuthorizationError
+from zfr.managers.transport import HttpxTransport
+
+_AUTHORIZATION_ERRORS = frozenset({HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN})
+"""Response status codes that indicate the client isn't permitted to make the request."""
+
+_FOLDER_NOT_FOUND = b'was not found for field folder'
+"""Error message returned when a plan is assigned to a folder that doesn't exist."""
+
+_CACHE_MAXSIZE = 256
+"""Maximum number of plans kept in a PlanManager's read cache."""
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+"""Headers sent with requests that have a pre-serialized JSON body."""
+
+_MAX_UPLOAD_WORKERS = 8
+"""Maximum number of attachments that are uploaded concurrently."""
+
+_UPDATE_PLAN_EXCLUDED = frozenset({'key', 'attachments'})
+"""PlanUpdate fields that aren't sent to the update plan endpoint."""
+
+DEFAULT_RETRY = Retry(
+    total=5,
+    backoff_factor=0.1,
+    status_forcelist=frozenset({500, 502, 503, 504}),
+    allowed_methods=frozenset({'GET', 'PUT', 'DELETE', 'HEAD'})
+)
+"""Retry policy shared by every HTTP adapter.
+
+PUT requests are retried as well, as the Zephyr API returns the occasional
+transient 503 when updating plans. POST requests are never retried, as the
+first attempt may have created the plan/folder, and a streamed attachment
+upload can't be sent again.
+"""
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """Requests adapter used to manage request timeouts."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize a new HTTP adapter with a preset timeout.
+
+        The connection pools are larger than the requests defaults, and never
+        block, so connections are kept alive for re-use when requests are made
+        concurrently (eg: uploading attachments). Failed requests are retried
+        using ```DEFAULT_RETRY```, unless ```max_retries``` is provided.
+
+        Args:
+            args: Standard HTTP Adapter arguments.
+            kwargs: Additional arguments.
+        """
+        self.timeout = 90
+        if 'timeout' in kwargs:
+            self.timeout = kwargs['timeout']
+            del kwargs['timeout']
+
+        kwargs.setdefault('max_retries', DEFAULT_RETRY)
+        kwargs.setdefault('pool_connections', 25)
+        kwargs.setdefault('pool_maxsize', 50)
+        kwargs.setdefault('pool_block', False)
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs) -> Response:
+        """Send the HTTP request.
+
+        Args:
+            request:
+            kwargs:
+
+        Returns:
+            Returns the HTTP response from the remote server.
+        """
+        timeout = kwargs.get('timeout')
+        if timeout is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def _response_hook(response: Response, *args, **kwargs) -> None:
+    """Request hook used to centrally manage handle HTTP errors.
+
+    This is used to response to authoriation or server-side errors
+    in one place, to avoid code duplication and ensure consistent
+    error handling behaviour. It's shared by every session, rather than
+    each manager registering its own bound method.
+
+    Args:
+        response: HTTP response recieved from the remote host.
+        args: HTTP response arguments.
+        kwargs: Additional custom args.
+    """
+    status_code = response.status_code
+    if status_code in _AUTHORIZATION_ERRORS:
+        raise AuthorizationError(f'Client does not have permission to perform this action. {response.request.method} {response.request.url}')
+    elif status_code > HTTPStatus.FORBIDDEN:
+        err_msg = (
+            'Unexpected response recieved from the remote server '
+            f'{status_code} {response.request.method} '
+            f'{response.request.url} {response.text}'
+        )
+        raise RuntimeError(err_msg)
+
+
+def build_session(url: str, username: str, password: str) -> sessions.BaseUrlSession:
+    """Create a HTTP session used to interact with the Zephyr Scale API.
+
+    The session sets a base url, auth credentials, a retry strategy, request
+    timeout value, and a single handler for all authentication/internal
+    server errors, so we don't need to keep passing the same information
+    all over the place. It can be shared between managers, so
+    they re-use the same connections to the Jira instance.
+
+    Args:
+        url: Jira URL.
+        username: Username used to make authenticated API calls.
+        password: Password used to make authenticated API calls.
+
+    Returns:
+        A new session.
+    """
+    # the base url needs a trailing slash, otherwise the last segment of the
+    # path is replaced when resolving relative endpoints.
+    session = sessions.BaseUrlSession(base_url=url if url.endswith('/') else f"{url}/")
+    session.auth = (username, password)
+    session.hooks['response'].append(_response_hook)
+
+    adapter = TimeoutHTTPAdapter(timeout=90)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _prepare_session(
+    session: Optional[Union[sessions.BaseUrlSession, HttpxTransport]],
+    url: str,
+    username: str,
+    password: str
+) -> Union[sessions.BaseUrlSession, HttpxTransport]:
+    """Get the session used by a manager to make API calls.
+
+    The managers' endpoints are relative (no leading slash), so they're
+    resolved against the session's base url, including any context path.
+
+    Args:
+        session: Session provided by the caller, if any.
+        url: Jira URL.
+        username: Username used to make authenticated API calls.
+        password: Password used to make authenticated API calls.
+
+    Returns:
+        The provided session, or a new one created by ```build_session```.
+    """
+    session = session or build_session(url, username, password)
+
+    # make sure the session has the shared handler for all authentication/
+    # internal server errors, in case it wasn't created by build_session.
+    if _response_hook not in session.hooks['response']:
+        session.hooks['response'].append(_response_hook)
+
+    return session
+
+
+def _merge_update(existing: Plan, plan: PlanUpdate) -> Plan:
+    """Apply the changes made by a successful update to the existing plan.
+
+    This avoids retrieving the plan again after updating it. As with the
+    update itself, empty fields are left unchanged.
+
+    Args:
+        existing: The plan prior to being modified. It isn't changed.
+        plan: The changes that were made to the plan.
+
+    Returns:
+        A copy of ```existing```, with the changes applied.
+    """
+    changes = {}
+    for name in ('issue_links', 'labels', 'name', 'objective', 'owner', 'status'):
+        value = getattr(plan, name)
+        if value:
+            changes[name] = value
+
+    if plan.folder:
+        changes['folder'] = plan.folder if plan.folder.startswith('/') else f"/{plan.folder}"
+
+    if plan.custom_fields:
+        changes['custom_fields'] = {**(existing.custom_fields or {}), **plan.custom_fields}
+
+    return replace(existing, **changes)
+
+
+class FolderManager:
+    """Manage Zephyr Scale folders."""
+
+    def __init__(
+        self,
+        url: str,
+        api_suffix: str,
+        username: str,
+        password: str,
+        session: Optional[Union[sessions.BaseUrlSession, HttpxTransport]] = None
+    ) -> None:
+        """Initialize a new FolderManager object.
+
+        Args:
+            url: Jira URL.
+            api_suffix: Content path used to access the Zephyr Scale REST API.
+            username: Username used to make authenticated API calls.
+            password: Password used to make authenticated API calls.
+            session: Session used to make the API calls. Managers that share a
+                session also share its connection pool. Either a requests
+                session, or a [HttpxTransport][zfr.managers.transport.HttpxTransport]
+                to use HTTP/2. If not provided, a new session is created.
+        """
+        self._url = url
+        self._api_suffix = api_suffix
+        self._folder_endpoint = f"{api_suffix}/folder"
+        self._session = _prepare_session(session, url, username, password)
+
+    def create(self, folder: FolderCreate) -> Folder:
+        """Create a new folder.
+
+        Args:
+            folder: Folder to be created.
+
+        Returns:
+            The created folder.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                create folders.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Folder][zfr.dataobjects.folder.Folder]
+        """
+        result: Optional[Folder] = None
+        endpoint = self._folder_endpoint
+
+        data = folder.to_api()
+
+        # zephyr requires the folder name to start with a forward slash when
+        # creating folders, but NOT start with a forward slash when updating
+        # a folder. We manage the inconsistency here to make things easier for
+        # users.
+        if not data['name'].startswith('/'):
+            data['name'] = f"/{data['name']}"
+
+        resp = self._session.post(endpoint, data=dumps(data), headers=_JSON_HEADERS)
+
+        if resp.status_code == HTTPStatus.CREATED:
+            resp_data = loads(resp.content)
+            result = Folder(
+                id=resp_data['id'],
+                name=folder.name.lstrip('/'),
+                type=folder.type
+            )
+        elif resp.status_code == HTTPStatus.BAD_REQUEST:
+            resp_data = loads(resp.content)
+            raise RuntimeError(', '.join(resp_data['errorMessages']))
+
+        return result
+
+    def update(self, folder: Folder) -> Folder:
+        """Update an existing folder.
+
+        Args:
+            folder: The modified folder.
+
+        Returns:
+            The updated Folder.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                modify folders.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Folder][zfr.dataobjects.folder.Folder]
+        """
+        endpoint = f"{self._folder_endpoint}/{folder.id}"
+
+        # only the name can be updated. Remove it if it's empty, so we don't
+        # delete existing data.
+        name = (folder.name or '').lstrip('/')
+        new_dict = {'name': name} if name else {}
+
+        resp = self._session.put(endpoint, data=dumps(new_dict), headers=_JSON_HEADERS)
+
+        if resp.status_code == HTTPStatus.OK:
+            return folder
+        elif resp.status_code == HTTPStatus.BAD_REQUEST:
+            resp_data = loads(resp.content)
+            raise RuntimeError(', '.join(resp_data['errorMessages']))
+
+
+class PlanManager:
+    """Manage test plans."""
+
+    def __init__(
+        self,
+        url: str,
+        api_suffix: str,
+        username: str,
+        password: str,
+        session: Optional[Union[sessions.BaseUrlSession, HttpxTransport]] = None,
+        cache_ttl: Optional[float] = 5.0
+    ) -> None:
+        """Initialize a PlanManager object.
+
+        Args:
+            url: Jira URL.
+            api_suffix: Content path used to access the Zephyr Scale REST API.
+            username: Username used to make authenticated API calls.
+            password: Password used to make authenticated API calls.
+            session: Session used to make the API calls. Managers that share a
+                session also share its connection pool. Either a requests
+                session, or a [HttpxTransport][zfr.managers.transport.HttpxTransport]
+                to use HTTP/2. If not provided, a new session is created.
+            cache_ttl: Number of seconds that retrieved plans are re-used for,
+                to collapse repeated reads of the same plan. Set to ```0``` or
+                ```None``` to always retrieve the latest version of a plan.
+        """
+        self._url = url
+        self._api_suffix = api_suffix
+        self._folder_endpoint = f"{api_suffix}/folder"
+        self._plan_endpoint = f"{api_suffix}/testplan"
+        self._plan_create_endpoint = f"{api_suffix}/testplan/"
+
+        # plans retrieved by get(), keyed on the get() arguments, along with
+        # the (monotonic) time that they expire. get_many() uses the cache
+        # from several threads, so it's only accessed while holding the lock.
+        self._cache_ttl = cache_ttl or 0
+        self._cache: Dict[Tuple, Tuple[float, Plan]] = {}
+        self._cache_lock = threading.Lock()
+
+        self._session = _prepare_session(session, url, username, password)
+
+    def create(self, plan: PlanCreate) -> Optional[Plan]:
+        """Create a new test plan.
+
+        Args:
+            plan: The plan to be created.
+
+        Returns:
+            The newly created plan.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                create plans.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        result: Optional[Plan] = None
+
+        # The Zephyr API will throw an error if you try to assign a
+        # non-existent folder to a plan, so we try to catch it, create
+        # the missing folder, then re-attempt to create the plan before
+        # giving up.
+
+        resp = self._create_plan(plan)
+
+        if resp.status_code == HTTPStatus.CREATED:
+            resp_data = loads(resp.content)
+            result = self.get(resp_data['key'])
+        elif resp.status_code == HTTPStatus.BAD_REQUEST:
+            result = self._handle_creation_error(plan, resp)
+            if not result:
+                raise RuntimeError(f"Failed to create  plan {plan.name}")
+
+        # If the plan was created, upload the attachments, and retrieve the
+        # plan again to get the updated metadata containing the attachment
+        # identifiers.
+        if result and plan.attachments:
+            self._upload_attachments(result.key, plan.attachments)
+            self._invalidate(result.key)
+            result = self.get(result.key)
+
+        return result
+
+    def delete(self, key: str) -> Optional[Plan]:
+        """Delete an existing test plan.
+
+        Args:
+            key: The plan to be deleted.
+
+        Returns:
+            Details of the deleted plan.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                delete plans.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        # exit early if the plan doesn't exist. Avoids making un-necessary
+        # api calls, including retrieving the attachments of a plan that's
+        # about to be deleted.
+        result: Optional[Plan] = self.get(key, include_attachments=False)
+        if not result:
+            return None
+
+        endpoint = f"{self._plan_endpoint}/{key}"
+
+        resp = self._session.delete(endpoint)
+        self._invalidate(key)
+
+        if resp.status_code == HTTPStatus.NO_CONTENT or resp.status_code == HTTPStatus.NOT_FOUND:
+            return result
+
+    def get(
+        self,
+        key: str,
+        fields: Optional[List[str]] = None,
+        include_attachments: bool = True
+    ) -> Optional[Plan]:
+        """Get an existing plan.
+
+        If the plan doesn't include its attachments, retrieving them requires a
+        second API call, which is only made if they are included in the
+        requested ```fields```.
+
+        Plans are cached for ```cache_ttl``` seconds, so repeated calls with the
+        same arguments don't make another API call. Each call returns its own
+        copy of the plan, and the cached plan is discarded when it's updated
+        or deleted through this manager.
+
+        Args:
+            key: The plan to be retrieved.
+            fields: Optionally limit the fieldsto be retrieved, to improve performance.
+            include_attachments: Set to ```False``` to skip retrieving the
+                attachments, regardless of the requested ```fields```.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                retrieve plans.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        result = None
+
+        cache_key = (key, tuple(fields) if fields else None, include_attachments)
+        if self._cache_ttl:
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return deepcopy(cached[1])
+
+        endpoint = f"{self._plan_endpoint}/{key}"
+        if fields:
+            endpoint += f"?fields={','.join(fields)}"
+                
+        resp = self._session.get(endpoint)        
+
+        if resp.status_code == HTTPStatus.OK:
+            result = Plan.from_api(loads(resp.content))
+        elif resp.status_code == HTTPStatus.NOT_FOUND:
+            result = None
+
+        # the attachments endpoint is only needed if the plan itself didn't
+        # include them.
+        if (
+            result and include_attachments and not result.attachments
+            and (not fields or 'attachments' in fields)
+        ):
+            result.attachments = self.get_attachments(result.key)
+
+        if result and self._cache_ttl:
+            self._cache_plan(cache_key, result)
+
+        return result
+
+    def get_attachments(self, key: str) -> Optional[List[Attachment]]:
+        """Get the list of file attachments on an existing plan.
+
+        Args:
+            key: Plan key.
+
+        Returns:
+           A list of attachments associated with the plan, or ```None``` if a
+           plan with the given key could not be found.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                retrieve attachments.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Attachment][zfr.dataobjects.Attachment]
+        """
+        result: Optional[List[Attachment]] = []
+
+        endpoint = f"{self._plan_endpoint}/{key}/attachments"
+
+        resp = self._session.get(endpoint)
+
+        if resp.status_code == HTTPStatus.OK:
+            result = [Attachment.from_api(x) for x in loads(resp.content)]
+        elif resp.status_code == HTTPStatus.NOT_FOUND:
+            result = None
+        
+        return result
+
+    def get_many(
+        self,
+        keys: List[str],
+        fields: Optional[List[str]] = None,
+        max_workers: int = 8
+    ) -> Dict[str, Optional[Plan]]:
+        """Get several existing plans concurrently.
+
+        Each plan is retrieved with [get][zfr.managers.PlanManager.get] on a
+        pool of worker threads, sharing the session's connection pool.
+
+        Args:
+            keys: The plans to be retrieved.
+            fields: Optionally limit the fields to be retrieved, to improve performance.
+            max_workers: Maximum number of plans retrieved at the same time.
+
+        Returns:
+            The plans keyed on plan key, in the order they were requested.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                retrieve plans.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_keys))) as pool:
+            plans = pool.map(partial(self.get, fields=fields), unique_keys)
+            return dict(zip(unique_keys, plans))
+
+    def update(self, plan: PlanUpdate) -> Optional[Plan]:
+        """Update an existing plan.
+
+        Args:
+            plan: The modified plan.
+
+        Returns:
+           The updated plan, or None if a plan with a matching key could not
+           be found.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                modify plans.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        # the update is based on the latest version of the plan, rather than
+        # a cached one, so stale values aren't sent back to the API.
+        self._invalidate(plan.key)
+
+        # the existing attachments are only needed if the plan won't be
+        # retrieved again after uploading new ones.
+        existing: Optional[Plan] = self.get(plan.key, include_attachments=not plan.attachments)
+        if not existing:
+            raise RuntimeError(f"No such plan - {plan.key}.")
+
+        # The Zephyr API will throw an error if you try to assign a
+        # non-existent folder to a plan, so we try to catch it, create
+        # the missing folder, then re-attempt to create the plan before
+        # giving up.
+        resp = self._update_plan(plan, existing)
+        self._invalidate(plan.key)
+
+        if resp.status_code == HTTPStatus.BAD_REQUEST:
+            result = self._handle_update_error(existing.project_key, plan, resp)
+            if not result:
+                raise RuntimeError(f"Failed to update {plan.name}.")
+
+            # the re-attempted update has already uploaded the attachments.
+            return result
+
+        # If the plan was updated, upload the attachments, and retrieve the
+        # plan again to get the updated metadata containing the attachment
+        # identifiers.
+        if plan.attachments:
+            self._upload_attachments(plan.key, plan.attachments)
+            return self.get(plan.key)
+
+        # the API only accepts the test cycle keys, so the plan needs to be
+        # retrieved again to get the details of the new test cycles.
+        if plan.test_runs:
+            result = self.get(plan.key, include_attachments=False)
+            if result:
+                result.attachments = existing.attachments
+            return result
+
+        return _merge_update(existing, plan)
+
+    def _cache_plan(self, cache_key: Tuple, plan: Plan) -> None:
+        """Add a retrieved plan to the read cache.
+
+        A copy of the plan is cached, so changes the caller makes to the plan
+        aren't seen by later calls. Expired plans are dropped once the cache is
+        full, and if it's still full, the whole cache is cleared rather than
+        tracking the oldest entry.
+
+        Args:
+            cache_key: The arguments the plan was retrieved with.
+            plan: The retrieved plan.
+        """
+        plan = deepcopy(plan)
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._cache) >= _CACHE_MAXSIZE:
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                if len(self._cache) >= _CACHE_MAXSIZE:
+                    self._cache = {}
+
+            self._cache[cache_key] = (now + self._cache_ttl, plan)
+
+    def _invalidate(self, key: str) -> None:
+        """Discard every cached copy of a plan.
+
+        Args:
+            key: Plan key.
+        """
+        with self._cache_lock:
+            for cache_key in [k for k in self._cache if k[0] == key]:
+                del self._cache[cache_key]
+
+    def _create_folder(self, folder: FolderCreate) -> Optional[Folder]:
+        """Create a new folder for logically grouping test plans.
+
+        Args:
+            folder: The folder to be created.
+
+        Returns:
+            A Folder object containing the folder configuration details.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                create folders.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Folder][zfr.dataobjects.plan.Folder]
+        """
+        result: Optional[Folder] = None
+
+        folder_dict = folder.to_api()
+
+        # zephyr requires the folder name to start with a forward slash when
+        # creating folders, but NOT start with a forward slash when updating
+        # a folder. We manage the inconsistency here to make things easier for
+        # users.
+        if not folder_dict['name'].startswith('/'):
+            folder_dict['name'] = f"/{folder_dict['name']}"
+
+        endpoint = self._folder_endpoint
+
+        resp = self._session.post(endpoint, data=dumps(folder_dict), headers=_JSON_HEADERS)
+
+        if resp.status_code == HTTPStatus.CREATED:
+            resp_data = loads(resp.content)
+            result = Folder(
+                id=resp_data['id'],
+                name=folder.name,
+                type=folder.type
+            )
+        elif resp.status_code == HTTPStatus.BAD_REQUEST:
+            resp_data = loads(resp.content)
+            raise RuntimeError(', '.join(resp_data['errorMessages']))
+
+        return result
+
+    def _create_plan(self, plan: PlanCreate) -> Response:
+        """Create a new plan.
+
+        Args:
+            plan: The plan to be created.
+
+        Returns:
+            A Response object with details of whether the plan creation was
+            successful or not.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        plan_dict = plan.to_api()
+
+        if 'attachments' in plan_dict:
+            plan_dict.pop('attachments')
+
+        if plan_dict['folder'] and not plan_dict['folder'].startswith('/'):
+            plan_dict['folder'] = f"/{plan_dict['folder']}"
+
+        endpoint = self._plan_create_endpoint
+        return self._session.post(endpoint, data=dumps(plan_dict), headers=_JSON_HEADERS)
+
+    def _handle_creation_error(self, plan: PlanCreate, resp: Response) -> Optional[Plan]:
+        """Attempt to gracefully handle errors when create a new plan.
+
+        Args:
+            plan: Plan to be created.
+            resp: HTTP response object containing the error details.
+
+        Returns:
+            A Response object with details of whether the plan creation was
+            successful or not.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        result: Optional[Plan] = None
+
+        # searching the raw response avoids decoding the error messages.
+        if _FOLDER_NOT_FOUND in resp.content:
+            new_folder = FolderCreate(
+                project_key=plan.project_key,
+                name=plan.folder,
+                type=FolderType.PLAN
+            )
+            created_folder: Optional[Folder] = self._create_folder(new_folder)
+
+            if created_folder:
+                result = self.create(plan)
+
+        return result
+
+    def _handle_update_error(self, project_key: str, plan: PlanUpdate, resp: Response) -> Optional[Plan]:
+        """Attempt to gracefully handle errors when updating an existing plan.
+
+        Args:
+            project_key: Project that the plan belongs to.
+            plan: The modified Plan.
+            resp: HTTP response object containing the error details.
+
+        Returns:
+            A Response object with details of whether the plan was successfully
+            updated.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        result: Optional[Plan] = None
+
+        # searching the raw response avoids decoding the error messages.
+        if _FOLDER_NOT_FOUND in resp.content:
+            new_folder = FolderCreate(
+                project_key=project_key,
+                name=plan.folder,
+                type=FolderType.PLAN
+            )
+            created_folder: Optional[Folder] = self._create_folder(new_folder)
+
+            if created_folder:
+                result = self.update(plan)
+
+        return result
+
+    def _update_plan(self, plan: PlanUpdate, existing: Plan) -> Response:
+        """Update an existing plan.
+
+        Args:
+            plan: The modified plan.
+            existing: The plan prior to being modified.
+
+        Returns:
+            A Response object with details of whether the plan was successfully
+            updated.
+
+        _See Also_:
+            [Plan][zfr.dataobjects.plan.Plan]
+        """
+        # get the status from the existing plan if it wasn't changed.
+        if not plan.status:
+            plan.status = existing.status
+
+        # to make it easier to work with Zephyr, the data object has some
+        # additional properties that aren't used by the REST API, so they're
+        # removed along with any empty fields, so we don't accidentally
+        # over-write data.
+        new_dict = {
+            key: value for key, value in plan.to_api().items()
+            if value and key not in _UPDATE_PLAN_EXCLUDED
+        }
+
+        # fix inconsistency with the way the Zephyr Scale API handles folder
+        # names
+        if 'folder' in new_dict and not new_dict['folder'].startswith('/'):
+            new_dict['folder'] = f"/{new_dict['folder']}"
+
+        endpoint = f"{self._plan_endpoint}/{plan.key}"
+
+        resp = self._session.put(endpoint, data=dumps(new_dict), headers=_JSON_HEADERS)
+
+        return resp
+
+    def _upload_attachments(self, key: str, attachments: List[str]) -> None:
+        """Upload one or more attachments to a test plan.
+
+        Args:
+            key: Plan key (eg: MYPROJECT-P123).
+            attachments: List of attachments to be uploaded.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                create folders.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+
+        _See Also_:
+            [Attachment][zfr.dataobjects.Attachment]
+        """
+        endpoint = f"{self._plan_endpoint}/{key}/attachments"
+        upload = partial(self._upload_attachment, endpoint, key)
+
+        if len(attachments) == 1:
+            upload(attachments[0])
+            return
+
+        # each upload is a separate request, so upload the files concurrently
+        # over the session's connection pool. list() is used to wait for the
+        # uploads to finish, and re-raise any errors.
+        with ThreadPoolExecutor(max_workers=min(_MAX_UPLOAD_WORKERS, len(attachments))) as pool:
+            list(pool.map(upload, attachments))
+
+    def _upload_attachment(self, endpoint: str, key: str, attachment: str) -> None:
+        """Upload a single attachment to a test plan.
+
+        Args:
+            endpoint: Attachments endpoint of the test plan.
+            key: Plan key (eg: MYPROJECT-P123).
+            attachment: Path to the file to be uploaded.
+
+        Raises:
+            AuthorizationError: If the client does not have permission to
+                create folders.
+            RuntimeError: If the Zephyr API returns an unexpected error.
+        """
+        with open(attachment, 'rb') as infile:
+            # stream the file from disk, rather than building the whole
+            # multipart body in memory.
+            upload_data = MultipartEncoder(
+                fields={'file': (os.path.basename(attachment), infile, 'application/octet-stream')}
+            )
+
+            resp = self._session.post(
+                endpoint,
+                data=upload_data,
+                headers={'Content-Type': upload_data.content_type}
+            )
+
+            if resp.status_code != HTTPStatus.CREATED:
+                err_msg = (
+                    f"Recieved HTTP response {resp.status_code} "
+                    f"attaching {attachment} to {key}."
+                )
+                raise RuntimeError(err_msg)
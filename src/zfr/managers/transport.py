@@ -0,0 +1,152 @@
+"""Alternative HTTP transport used to interact with the Zephyr Scale API."""
+
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # optional, installed by the "http2" extra
+    httpx = None
+
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+"""Number of bytes read at a time when streaming a file-like request body."""
+
+
+class HttpxTransport:
+    """HTTP/2 client that can be used in place of a requests session.
+
+    Mirrors the parts of the requests session API used by the managers
+    (```get```, ```post```, ```put```, ```delete``` and the response
+    ```hooks```), so it can be passed to a manager as its ```session```.
+    Under HTTP/2, concurrent requests (eg: uploading attachments, or
+    ```PlanManager.get_many```) are multiplexed over a single connection,
+    rather than each waiting for a connection of its own.
+
+    Unlike the requests session created by ```build_session```, failed
+    requests are only retried if the connection couldn't be established.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        http2: bool = True,
+        timeout: float = 90,
+        retries: int = 5
+    ) -> None:
+        """Initialize a new transport.
+
+        Args:
+            url: Jira URL.
+            username: Username used to make authenticated API calls.
+            password: Password used to make authenticated API calls.
+            http2: Set to ```False``` to only use HTTP/1.1.
+            timeout: Number of seconds to wait before a request times out.
+            retries: Number of times to retry a failed connection attempt.
+
+        Raises:
+            ImportError: If httpx isn't installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                'HttpxTransport requires httpx, install it with the "http2" extra.'
+            )
+
+        self.hooks: Dict[str, List[Callable[..., Any]]] = {'response': []}
+
+        # httpx ignores the client's http2/limits options when a transport is
+        # provided, so the connection pool is configured on the transport.
+        transport = httpx.HTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            retries=retries
+        )
+
+        # the base url needs a trailing slash, so relative endpoints are
+        # resolved against the full Jira url, including any context path.
+        self._client = httpx.Client(
+            base_url=url if url.endswith('/') else f"{url}/",
+            auth=(username, password),
+            timeout=timeout,
+            transport=transport
+        )
+
+    def __enter__(self) -> 'HttpxTransport':
+        """Use the transport as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the transport."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connections."""
+        self._client.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> 'httpx.Response':
+        """Send a HTTP request, and run the response hooks.
+
+        Args:
+            method: HTTP method (eg: GET).
+            url: Endpoint, relative to the Jira url.
+            data: Request body. Either bytes, or a file-like object (eg: a
+                ```MultipartEncoder```), which is streamed in chunks.
+            headers: Additional request headers.
+
+        Returns:
+            The HTTP response from the remote server.
+        """
+        content, headers = _request_body(data, headers)
+        response = self._client.request(method, url, content=content, headers=headers)
+
+        for hook in self.hooks['response']:
+            hook(response)
+
+        return response
+
+    def get(self, url: str, **kwargs) -> 'httpx.Response':
+        """Send a GET request, see ```request```."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> 'httpx.Response':
+        """Send a POST request, see ```request```."""
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> 'httpx.Response':
+        """Send a PUT request, see ```request```."""
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> 'httpx.Response':
+        """Send a DELETE request, see ```request```."""
+        return self.request('DELETE', url, **kwargs)
+
+
+def _request_body(data: Any, headers: Optional[Dict[str, str]]) -> Tuple[Any, Dict[str, str]]:
+    """Convert a requests style request body to one accepted by httpx.
+
+    httpx doesn't accept file-like objects as the request body, so they're
+    read in chunks instead. If the size of the body is known, it's sent as the
+    content length, rather than falling back to a chunked transfer encoding.
+
+    Args:
+        data: Request body.
+        headers: Request headers.
+
+    Returns:
+        The request body and headers.
+    """
+    headers = dict(headers or {})
+    if hasattr(data, 'read'):
+        length = getattr(data, 'len', None)
+        if length is not None:
+            headers.setdefault('Content-Length', str(length))
+        data = iter(partial(data.read, _UPLOAD_CHUNK_SIZE), b'')
+
+    return data, headers
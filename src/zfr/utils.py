@@ -1,144 +1,227 @@
-"""zfr CLI utility methods/objects."""
-
-import os
-import re
-
-from argparse import Action
-from requests import Response
-from requests.adapters import HTTPAdapter
-from typing import Dict, List, Union
-
-
-def camel_to_snake(s: str) -> str:
-    """Convert a string from camelCase string to snake_case.
-
-    Args:
-        s: String to be converted.
-
-    Returns:
-        A string where camelCase words have been converted to snake_case.
-    """
-    return re.sub(r'(?<!^)(?=[A-Z])', '_', s).lower()
-
-
-def snake_to_camel(s: str) -> str:
-    """Convert a string from snake_case to camelCase.
-
-    Args:
-        s: String to be converted.
-
-    Returns:
-        A string where snake_case words have been converted to camelCase.
-    """
-    components = s.split('_')
-    return components[0] + ''.join(x.title() for x in components[1:])
-
-
-def dict_to_snake(data: Union[Dict, List]) -> Dict:
-    """Convert dictionary keys from camel case to snake case.
-
-    This function is used when translating dataclasses to/from
-    their JSON respresentation in order to align the attribute
-    names to what the Zephyr Scale REST API expects to see.
-
-    Args:
-        s: String to be converted.
-
-    Returns:
-        A dict, where each key has been converted from camelCase to snake_case.
-    """
-    if isinstance(data, list):
-        return [
-            dict_to_snake(entry) if isinstance(entry, (dict, list))
-            else entry for entry in data
-        ]
-    else:
-        return {
-            camel_to_snake(key): dict_to_snake(val) if isinstance(val, (dict, list))
-            else val for key, val in data.items()
-        }
-
-
-def dict_to_camel(data: Union[Dict, List]) -> Dict:
-    """Convert dictionary keys from snake case to camel case.
-
-    This function is used when translating dataclasses to/from
-    their JSON representation in order to align the attribute
-    names to what the Zephyr Scale REST API expects to see.
-
-    Args:
-        data: The dictionary to convert.
-
-    Returns:
-        A new dictionary, where the keys have been translated from snake_case to camelCase.
-    """
-    if isinstance(data, list):
-        return [
-            dict_to_camel(entry) if isinstance(entry, (dict, list))
-            else entry for entry in data
-        ]
-
-    return {
-        snake_to_camel(key): dict_to_camel(val) if isinstance(val, (dict, list))
-        else val for key, val in data.items()
-    }
-
-
-class EnvDefault(Action):
-    """Custom action used to set CLI arguments via environment variables."""
-
-    def __init__(self, envvar: str, required=True, default=None, **kwargs) -> None:
-        """Initialize the action.
-
-        Args:
-            envvar: Name of the environment variable to read the argument value from.
-            required: ```True``` to make the argument mandatory, otherwise ```False```.
-            default: Default value is none is specified by the user.
-            kwargs: Extra argument configuration options.
-        """
-        if not default and envvar:
-            default = os.getenv(envvar, None)
-
-        if required and default:
-            required = False
-       
-        super(EnvDefault, self).__init__(
-            default=default,
-            required=required,
-            **kwargs
-        )
-
-    def __call__(self, parser, namespace, values, option_string=None):
-        setattr(namespace, self.dest, values)
-
-
-class TimeoutHTTPAdapter(HTTPAdapter):
-    """Requests adapter used to manage request timeouts."""
-
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialize a new HTTP adapter with a preset timeout.
-
-        Args:
-            args: Standard HTTP Adapter arguments.
-            kwargs: Additional arguments.
-        """
-        self.timeout = 90
-        if 'timeout' in kwargs:
-            self.timeout = kwargs['timeout']
-            del kwargs['timeout']
-        super().__init__(*args, **kwargs)
-
-    def send(self, request, **kwargs) -> Response:
-        """Send the HTTP request.
-
-        Args:
-            request:
-            kwargs:
-
-        Returns:
-            Returns the HTTP response from the remote server.
-        """
-        timeout = kwargs.get('timeout')
-        if timeout is None:
-            kwargs['timeout'] = self.timeout
-        return super().send(request, **kwargs)
+"""zfr CLI utility methods/objects."""
+
+import os
+import re
+
+from argparse import Action
+from configparser import ConfigParser
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Union
+
+_CAMEL_CASE_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
+"""Matches the position before each capital letter, except at the start."""
+
+_MOVED_TO_MANAGERS = frozenset({'DEFAULT_RETRY', 'TimeoutHTTPAdapter'})
+"""Names that moved to zfr.managers, so the CLI doesn't import requests."""
+
+
+def __getattr__(name: str) -> Any:
+    """Import the names that moved to ```zfr.managers``` on first use.
+
+    Args:
+        name: Name of the attribute that wasn't found.
+
+    Returns:
+        The attribute from ```zfr.managers```.
+
+    Raises:
+        AttributeError: If the attribute doesn't exist.
+    """
+    if name in _MOVED_TO_MANAGERS:
+        from zfr import managers
+        return getattr(managers, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1024)
+def camel_to_snake(s: str) -> str:
+    """Convert a string from camelCase string to snake_case.
+
+    Results are cached, as the same handful of keys are converted for every
+    object in an API response.
+
+    Args:
+        s: String to be converted.
+
+    Returns:
+        A string where camelCase words have been converted to snake_case.
+    """
+    return _CAMEL_CASE_BOUNDARY.sub('_', s).lower()
+
+
+@lru_cache(maxsize=1024)
+def snake_to_camel(s: str) -> str:
+    """Convert a string from snake_case to camelCase.
+
+    Results are cached, as the same handful of keys are converted for every
+    object sent to the API.
+
+    Args:
+        s: String to be converted.
+
+    Returns:
+        A string where snake_case words have been converted to camelCase.
+    """
+    first, *rest = s.split('_')
+    return first + ''.join(map(str.title, rest))
+
+
+@lru_cache(maxsize=None)
+def build_field_map(cls: type) -> Dict[str, str]:
+    """Build the camelCase name of each field of a dataclass.
+
+    The map is only built once per class, so converting an instance doesn't
+    need to convert any names.
+
+    Args:
+        cls: Dataclass to build the map for.
+
+    Returns:
+        A dict mapping each field name to its camelCase name.
+    """
+    return {f.name: snake_to_camel(f.name) for f in fields(cls)}
+
+
+def dataclass_to_camel(obj: Any) -> Dict[str, Any]:
+    """Convert a dataclass instance into a dict with camelCase keys.
+
+    Equivalent to ```dict_to_camel(dataclasses.asdict(obj))```, but the keys
+    are looked up in the class's field map, rather than being converted, and
+    field values aren't deep copied.
+
+    Args:
+        obj: Dataclass instance to be converted.
+
+    Returns:
+        A dict mapping each camelCase field name to its value.
+    """
+    result = {}
+    for name, camel_name in build_field_map(type(obj)).items():
+        value = getattr(obj, name)
+        if hasattr(type(value), '__dataclass_fields__'):
+            value = dataclass_to_camel(value)
+        elif isinstance(value, list):
+            value = [
+                dataclass_to_camel(entry) if hasattr(type(entry), '__dataclass_fields__')
+                else entry for entry in value
+            ]
+        result[camel_name] = value
+
+    return result
+
+
+def _convert_keys(data: Union[Dict, List], convert: Callable[[str], str]) -> Union[Dict, List]:
+    """Copy nested dicts/lists, converting the dictionary keys.
+
+    The structure is walked with an explicit stack rather than recursion, and
+    each output container is allocated once and filled in place. Exact type
+    checks are used, as JSON documents only contain plain dicts and lists.
+
+    Args:
+        data: The dictionary or list to convert.
+        convert: Function used to convert each key.
+
+    Returns:
+        A copy of ```data```, with every dictionary key converted.
+    """
+    result: Union[Dict, List] = [] if type(data) is list else {}
+    stack = [(data, result)]
+
+    while stack:
+        source, target = stack.pop()
+
+        if type(source) is list:
+            for value in source:
+                value_type = type(value)
+                if value_type is dict or value_type is list:
+                    copy = {} if value_type is dict else []
+                    stack.append((value, copy))
+                    value = copy
+                target.append(value)
+        else:
+            for key, value in source.items():
+                value_type = type(value)
+                if value_type is dict or value_type is list:
+                    copy = {} if value_type is dict else []
+                    stack.append((value, copy))
+                    value = copy
+                target[convert(key)] = value
+
+    return result
+
+
+def dict_to_snake(data: Union[Dict, List]) -> Dict:
+    """Convert dictionary keys from camel case to snake case.
+
+    This function is used when translating dataclasses to/from
+    their JSON respresentation in order to align the attribute
+    names to what the Zephyr Scale REST API expects to see.
+
+    Args:
+        s: String to be converted.
+
+    Returns:
+        A dict, where each key has been converted from camelCase to snake_case.
+    """
+    return _convert_keys(data, camel_to_snake)
+
+
+def dict_to_camel(data: Union[Dict, List]) -> Dict:
+    """Convert dictionary keys from snake case to camel case.
+
+    This function is used when translating dataclasses to/from
+    their JSON representation in order to align the attribute
+    names to what the Zephyr Scale REST API expects to see.
+
+    Args:
+        data: The dictionary to convert.
+
+    Returns:
+        A new dictionary, where the keys have been translated from snake_case to camelCase.
+    """
+    return _convert_keys(data, snake_to_camel)
+
+
+def load_ini(path: Union[str, os.PathLike], section: str) -> Dict[str, str]:
+    """Load a section of an INI file.
+
+    Args:
+        path: Path to the INI file.
+        section: Name of the section to load.
+
+    Returns:
+        A dict containing the options defined in the section.
+    """
+    config_parser = ConfigParser()
+    config_parser.read(path)
+    return dict(config_parser.items(section))
+
+
+class EnvDefault(Action):
+    """Custom action used to set CLI arguments via environment variables."""
+
+    def __init__(self, envvar: str, required=True, default=None, **kwargs) -> None:
+        """Initialize the action.
+
+        Args:
+            envvar: Name of the environment variable to read the argument value from.
+            required: ```True``` to make the argument mandatory, otherwise ```False```.
+            default: Default value is none is specified by the user.
+            kwargs: Extra argument configuration options.
+        """
+        if not default and envvar:
+            default = os.getenv(envvar, None)
+
+        if required and default:
+            required = False
+       
+        super(EnvDefault, self).__init__(
+            default=default,
+            required=required,
+            **kwargs
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        setattr(namespace, self.dest, values)
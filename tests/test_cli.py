@@ -0,0 +1,64 @@
+"""Tests for the zfr-folder and zfr-plan CLI utilities."""
+
+import sys
+
+import pytest
+
+from zfr.cli import folder, plan
+from zfr.cli._common import extract_config_arg, sniff_subcommand
+
+_CREDENTIALS = ['--url', 'https://jira.local', '--username', 'user', '--password', 'secret']
+
+
+@pytest.mark.parametrize('cli', [folder.cli, plan.cli])
+def test_help_is_the_only_output(cli, capsys, monkeypatch, tmp_path):
+    """Help is written to stdout, without any other lines before it."""
+    config = str(tmp_path / 'missing.cfg')
+    monkeypatch.setattr(sys, 'argv', ['zfr', '--config', config, '--help'])
+
+    with pytest.raises(SystemExit):
+        cli()
+
+    assert capsys.readouterr().out.startswith('usage:')
+
+
+@pytest.mark.parametrize('cli', [folder.cli, plan.cli])
+def test_no_sub_command_only_prints_help(cli, capsys, monkeypatch, tmp_path):
+    """Running without a sub-command only displays the help."""
+    config = str(tmp_path / 'missing.cfg')
+    monkeypatch.setattr(sys, 'argv', ['zfr', '--config', config] + _CREDENTIALS)
+
+    cli()
+
+    assert capsys.readouterr().out.startswith('usage:')
+
+
+@pytest.mark.parametrize('argv, expected', [
+    ([], None),
+    (['create', '--name', 'foo'], 'create'),
+    (['--url', 'https://jira.local', '--username', 'user', 'get'], 'get'),
+    (['--url=https://jira.local', '--username=user', 'get'], 'get'),
+    (['--config', 'create', 'update'], 'update'),
+    (['-h', 'create'], None),
+    (['--help', 'create'], None),
+    (['create', '-h'], 'create'),
+    (['--', 'create'], 'create'),
+    (['unknown'], 'unknown'),
+    (['--url', 'https://jira.local'], None)
+])
+def test_sniff_subcommand(argv, expected):
+    """The sub-command is found without parsing the CLI arguments."""
+    assert sniff_subcommand(argv) == expected
+
+
+@pytest.mark.parametrize('argv, expected', [
+    ([], None),
+    (['--config', 'zfr.cfg', 'create'], 'zfr.cfg'),
+    (['create', '--config=zfr.cfg'], 'zfr.cfg'),
+    (['--url', 'https://jira.local', '--config', 'zfr.cfg'], 'zfr.cfg'),
+    (['create', '--config'], None),
+    (['--', '--config', 'zfr.cfg'], None)
+])
+def test_extract_config_arg(argv, expected):
+    """The configuration file is found without parsing the CLI arguments."""
+    assert extract_config_arg(argv) == expected
@@ -0,0 +1,25 @@
+"""Tests for the CLI commands."""
+
+import contextlib
+import io
+import json
+
+from zfr.commands import CommandBase
+from zfr.dataobjects.folder import Folder
+
+
+def test_write_result_to_text_stream():
+    """Results can be written to a stdout that has no underlying buffer."""
+    stdout = io.StringIO()
+
+    with contextlib.redirect_stdout(stdout):
+        CommandBase._write_result(None, Folder(id=11, name='foo', type='TEST_PLAN'))
+
+    assert json.loads(stdout.getvalue()) == {'id': 11, 'name': '/foo', 'type': 'TEST_PLAN'}
+
+
+def test_write_result_to_binary_stream(capfdbinary):
+    """Results are written to stdout as compact JSON, followed by a newline."""
+    CommandBase._write_result(None, Folder(id=11, name='foo', type='TEST_PLAN'))
+
+    assert capfdbinary.readouterr().out == b'{"id":11,"name":"/foo","type":"TEST_PLAN"}\n'
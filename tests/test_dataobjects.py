@@ -0,0 +1,99 @@
+"""Tests for the generated API conversions of the data objects."""
+
+from zfr.dataobjects import Comment
+from zfr.dataobjects.cycle import TestCycle as Cycle
+from zfr.dataobjects.folder import Folder, FolderCreate, FolderType
+from zfr.dataobjects.plan import Attachment, Plan, PlanCreate, PlanUpdate
+
+_PLAN = {
+    'attachments': [{'id': 1, 'url': 'https://jira.local/1', 'filename': 'a.txt', 'filesize': 3}],
+    'comments': [{'createdBy': 'user', 'createdOn': '2021-09-23T16:18:52.862Z', 'body': 'hi'}],
+    'createdBy': 'JIRAUSER10000',
+    'createdOn': '2021-09-23T16:18:52.862Z',
+    'customFields': {'team': 'a'},
+    'folder': '/bar',
+    'issueLinks': ['PZ-1'],
+    'key': 'PZ-P12',
+    'labels': ['a', 'b'],
+    'name': 'Some Plan',
+    'objective': 'Test all the things',
+    'owner': 'user',
+    'projectKey': 'PZ',
+    'status': 'Draft',
+    'testRuns': [{'key': 'PZ-C1', 'status': 'Done', 'estimatedTime': 60, 'folder': '/cycles'}],
+    'updatedBy': 'user',
+    'updatedOn': '2021-09-23T16:19:49.796Z'
+}
+
+
+def test_missing_keys_use_defaults():
+    """Fields missing from the response keep their defaults."""
+    plan = Plan.from_api({'key': 'PZ-P12'})
+
+    assert plan.key == 'PZ-P12'
+    assert (plan.name, plan.labels, plan.test_runs, plan.created_on) == ('', (), (), None)
+    assert plan.custom_fields == {}
+    assert Plan.from_api({}).custom_fields is not plan.custom_fields
+
+
+def test_null_keys_use_defaults():
+    """Null values fall back to the default, or a new value from the factory."""
+    plan = Plan.from_api({
+        'key': 'PZ-P12',
+        'name': None,
+        'labels': None,
+        'customFields': None,
+        'testRuns': None,
+        'attachments': None,
+        'updatedOn': None
+    })
+
+    assert (plan.name, plan.labels, plan.test_runs, plan.attachments) == ('', (), (), ())
+    assert plan.custom_fields == {}
+    assert plan.updated_on is None
+
+
+def test_nested_round_trip():
+    """Nested test cycles, attachments and comments are converted both ways."""
+    plan = Plan.from_api(_PLAN)
+
+    assert plan.test_runs == [Cycle(key='PZ-C1')]
+    assert plan.test_runs[0].estimated_time == 60
+    assert plan.attachments == [Attachment(id=1)]
+    assert plan.attachments[0].filename == 'a.txt'
+    assert isinstance(plan.comments[0], Comment)
+
+    api = plan.to_api()
+    assert api['testRuns'][0]['estimatedTime'] == 60
+    assert api['attachments'] == _PLAN['attachments']
+    assert api['comments'] == _PLAN['comments']
+    assert Plan.from_api(api).to_api() == api
+
+
+def test_folder_init():
+    """Folder names are normalised by the hand-written Folder constructor."""
+    assert Folder.from_api({'id': 11, 'name': 'foo', 'type': 'TEST_RUN'}) == Folder(
+        id=11, name='/foo', type=FolderType.CYCLE
+    )
+    assert Folder.from_api({'id': 11, 'name': '/foo'}).name == '/foo'
+    assert Folder.from_api({}) == Folder(id=0, name=None, type=FolderType.PLAN)
+    assert Folder(name='bar').to_api() == {'id': 0, 'name': '/bar', 'type': 'TEST_PLAN'}
+
+
+def test_to_api_keys():
+    """Data objects are converted using the exact Zephyr Scale API field names."""
+    assert list(Plan().to_api()) == list(_PLAN)
+    assert list(PlanCreate().to_api()) == [
+        'attachments', 'customFields', 'folder', 'issueLinks', 'labels', 'name',
+        'objective', 'owner', 'projectKey', 'status', 'testRunKeys'
+    ]
+    assert list(PlanUpdate().to_api()) == [
+        'attachments', 'customFields', 'folder', 'issueLinks', 'key', 'labels', 'name',
+        'objective', 'owner', 'status', 'testRuns'
+    ]
+    assert list(Cycle().to_api()) == [
+        'createdBy', 'createdOn', 'description', 'estimatedTime', 'folder', 'issueCount',
+        'issueKey', 'key', 'name', 'owner', 'plannedEndDate', 'plannedStartDate',
+        'projectKey', 'status', 'testCaseCount', 'updatedBy', 'updatedOn'
+    ]
+    assert list(FolderCreate().to_api()) == ['name', 'projectKey', 'type']
@@ -0,0 +1,188 @@
+"""Tests for the test plan/folder managers."""
+
+import json
+
+from types import SimpleNamespace
+
+import pytest
+
+from zfr.dataobjects.plan import Plan, PlanUpdate
+from zfr.managers import _merge_update, PlanManager
+
+_PLAN = {
+    'key': 'PZ-P12',
+    'name': 'Some Plan',
+    'projectKey': 'PZ',
+    'status': 'Draft',
+    'customFields': {'team': 'a'},
+    'attachments': [{'id': 1, 'filename': 'report.txt'}]
+}
+
+
+class FakeSession:
+    """Records the requests made by a manager, and returns canned responses."""
+
+    def __init__(self, routes):
+        """Initialize the session.
+
+        Args:
+            routes: ```(status code, body)``` keyed on ```(method, endpoint)```.
+                A list of responses is returned one at a time, in order.
+        """
+        self.hooks = {'response': []}
+        self.routes = routes
+        self.calls = []
+        self.bodies = []
+
+    def _request(self, method, url, **kwargs):
+        self.calls.append((method, url))
+        self.bodies.append(kwargs.get('data'))
+        route = self.routes.get((method, url), (404, None))
+        status_code, body = route.pop(0) if isinstance(route, list) else route
+        response = SimpleNamespace(
+            status_code=status_code,
+            content=b'' if body is None else json.dumps(body).encode('utf-8'),
+            request=SimpleNamespace(method=method, url=url),
+            text=''
+        )
+
+        for hook in self.hooks['response']:
+            hook(response)
+
+        return response
+
+    def get(self, url, **kwargs):
+        return self._request('GET', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self._request('PUT', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self._request('POST', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self._request('DELETE', url, **kwargs)
+
+
+@pytest.fixture
+def session():
+    """Session that knows about a single plan."""
+    return FakeSession({
+        ('GET', 'api/testplan/PZ-P12'): (200, _PLAN),
+        ('PUT', 'api/testplan/PZ-P12'): (200, None),
+        ('DELETE', 'api/testplan/PZ-P12'): (204, None)
+    })
+
+
+def _manager(session, cache_ttl=5.0):
+    return PlanManager('https://jira.local', 'api', 'user', 'secret', session, cache_ttl)
+
+
+def test_merge_update_leaves_existing_plan_unchanged():
+    """The merged plan is a new object, and the existing plan isn't modified."""
+    existing = Plan(key='PZ-P12', name='Some Plan', custom_fields={'team': 'a'})
+
+    result = _merge_update(
+        existing,
+        PlanUpdate(key='PZ-P12', name='Other Plan', folder='bar', custom_fields={'area': 'b'})
+    )
+
+    assert result is not existing
+    assert (result.name, result.folder) == ('Other Plan', '/bar')
+    assert result.custom_fields == {'team': 'a', 'area': 'b'}
+    assert (existing.name, existing.folder) == ('Some Plan', '')
+    assert existing.custom_fields == {'team': 'a'}
+
+
+def test_get_returns_a_copy_of_the_cached_plan(session):
+    """Repeated calls are served from the cache, without sharing one instance."""
+    manager = _manager(session)
+
+    first = manager.get('PZ-P12')
+    first.name = 'Changed'
+    second = manager.get('PZ-P12')
+
+    assert second is not first
+    assert second.name == 'Some Plan'
+    assert session.calls == [('GET', 'api/testplan/PZ-P12')]
+
+
+def test_get_without_cache(session):
+    """Every call retrieves the plan when the cache is disabled."""
+    manager = _manager(session, cache_ttl=0)
+
+    manager.get('PZ-P12')
+    manager.get('PZ-P12')
+
+    assert session.calls.count(('GET', 'api/testplan/PZ-P12')) == 2
+
+
+def test_update_retrieves_the_latest_plan(session):
+    """Updates ignore the cache, and don't modify a plan returned earlier."""
+    manager = _manager(session)
+    plan = manager.get('PZ-P12')
+
+    result = manager.update(PlanUpdate(key='PZ-P12', name='Other Plan'))
+
+    assert result is not plan
+    assert result.name == 'Other Plan'
+    assert plan.name == 'Some Plan'
+    assert session.calls == [
+        ('GET', 'api/testplan/PZ-P12'),
+        ('GET', 'api/testplan/PZ-P12'),
+        ('PUT', 'api/testplan/PZ-P12')
+    ]
+
+
+def test_update_discards_the_cached_plan(session):
+    """The plan is retrieved again after it has been updated."""
+    manager = _manager(session)
+
+    manager.update(PlanUpdate(key='PZ-P12', name='Other Plan'))
+    manager.get('PZ-P12')
+
+    assert session.calls[-1] == ('GET', 'api/testplan/PZ-P12')
+    assert len(session.calls) == 3
+
+
+def test_get_many(session):
+    """Plans are returned in the order they were requested, without duplicates."""
+    session.routes[('GET', 'api/testplan/PZ-P13')] = (200, {**_PLAN, 'key': 'PZ-P13'})
+    manager = _manager(session, cache_ttl=0)
+
+    result = manager.get_many(['PZ-P13', 'PZ-P12', 'PZ-P13'])
+
+    assert list(result) == ['PZ-P13', 'PZ-P12']
+    assert [plan.key for plan in result.values()] == ['PZ-P13', 'PZ-P12']
+    assert len(session.calls) == 2
+
+
+def test_get_many_raises_errors(session):
+    """An error retrieving any of the plans is raised to the caller."""
+    session.routes[('GET', 'api/testplan/PZ-P13')] = (500, None)
+    manager = _manager(session)
+
+    with pytest.raises(RuntimeError, match='500 GET api/testplan/PZ-P13'):
+        manager.get_many(['PZ-P12', 'PZ-P13'])
+
+
+def test_update_creates_missing_folder(session):
+    """A missing folder is created, and the update is attempted again."""
+    error = {'errorMessages': ["Folder '/new' was not found for field folder on PZ."]}
+    session.routes[('PUT', 'api/testplan/PZ-P12')] = [(400, error), (200, None)]
+    session.routes[('POST', 'api/folder')] = (201, {'id': 5})
+    manager = _manager(session)
+
+    result = manager.update(PlanUpdate(key='PZ-P12', folder='new'))
+
+    assert result.folder == '/new'
+    assert session.calls == [
+        ('GET', 'api/testplan/PZ-P12'),
+        ('PUT', 'api/testplan/PZ-P12'),
+        ('POST', 'api/folder'),
+        ('GET', 'api/testplan/PZ-P12'),
+        ('PUT', 'api/testplan/PZ-P12')
+    ]
+    assert json.loads(session.bodies[2]) == {
+        'name': '/new', 'projectKey': 'PZ', 'type': 'TEST_PLAN'
+    }
@@ -0,0 +1,65 @@
+"""Tests for the httpx based HTTP/2 transport."""
+
+import io
+
+import pytest
+
+httpx = pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+from requests_toolbelt import MultipartEncoder  # noqa: E402
+from zfr.managers.transport import HttpxTransport  # noqa: E402
+
+
+@pytest.fixture
+def received():
+    """Requests received by the mock server."""
+    return []
+
+
+@pytest.fixture
+def transport(received):
+    """Transport connected to a mock server, that records every request."""
+    def handler(request):
+        received.append((request, request.read()))
+        return httpx.Response(201, json={'key': 'PZ-P12'})
+
+    transport = HttpxTransport('https://jira.local/jira', 'user', 'secret')
+    transport._client._transport = httpx.MockTransport(handler)
+    yield transport
+    transport.close()
+
+
+def test_response_hooks_are_run(transport):
+    """Every response is passed to the response hooks."""
+    responses = []
+    transport.hooks['response'].append(responses.append)
+
+    response = transport.get('rest/atm/1.0/testplan/PZ-P12')
+
+    assert responses == [response]
+
+
+def test_endpoints_keep_the_context_path(transport, received):
+    """Relative endpoints are resolved against the full Jira url."""
+    transport.get('rest/atm/1.0/testplan/PZ-P12')
+
+    assert str(received[0][0].url) == 'https://jira.local/jira/rest/atm/1.0/testplan/PZ-P12'
+
+
+def test_multipart_body_has_content_length(transport, received):
+    """Streamed multipart bodies are sent in full, with their length."""
+    upload = MultipartEncoder(
+        fields={'file': ('a.txt', io.BytesIO(b'hello'), 'application/octet-stream')}
+    )
+
+    response = transport.post(
+        'rest/atm/1.0/testplan/PZ-P12/attachments',
+        data=upload,
+        headers={'Content-Type': upload.content_type}
+    )
+
+    request, body = received[0]
+    assert response.status_code == 201
+    assert request.headers['Content-Length'] == str(len(body))
+    assert b'hello' in body
@@ -0,0 +1,54 @@
+"""Tests for the zfr utility functions."""
+
+from dataclasses import asdict
+
+from zfr.dataobjects.cycle import TestCycle as Cycle
+from zfr.dataobjects.plan import Attachment, Plan
+from zfr.utils import (
+    build_field_map,
+    camel_to_snake,
+    dataclass_to_camel,
+    dict_to_camel,
+    dict_to_snake,
+    snake_to_camel
+)
+
+
+def test_key_conversion():
+    """Keys are converted between camelCase and snake_case."""
+    assert camel_to_snake('projectKey') == 'project_key'
+    assert snake_to_camel('test_run_keys') == 'testRunKeys'
+    assert snake_to_camel('key') == 'key'
+
+
+def test_nested_dict_conversion():
+    """Keys of nested dicts, including dicts inside lists, are converted."""
+    data = {'testRuns': [{'plannedEndDate': None}], 'customFields': {'someField': 1}}
+
+    assert dict_to_snake(data) == {
+        'test_runs': [{'planned_end_date': None}],
+        'custom_fields': {'some_field': 1}
+    }
+    assert dict_to_camel(dict_to_snake(data)) == data
+
+
+def test_dataclass_to_camel():
+    """Dataclasses convert the same as converting the keys of asdict()."""
+    plan = Plan(
+        key='PZ-P12',
+        project_key='PZ',
+        attachments=[Attachment(id=1)],
+        test_runs=[Cycle(key='PZ-C1')]
+    )
+
+    assert build_field_map(Plan)['project_key'] == 'projectKey'
+    assert dataclass_to_camel(plan) == dict_to_camel(asdict(plan))
+
+
+def test_http_adapter_is_imported_lazily():
+    """The HTTP adapter can still be imported from zfr.utils."""
+    from zfr import managers
+    from zfr.utils import DEFAULT_RETRY, TimeoutHTTPAdapter
+
+    assert TimeoutHTTPAdapter is managers.TimeoutHTTPAdapter
+    assert DEFAULT_RETRY is managers.DEFAULT_RETRY